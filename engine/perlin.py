@@ -1,19 +1,105 @@
 """
 Lightweight Perlin noise implementation for organic fish animation.
 Uses permutation table and gradient interpolation for smooth, natural motion.
+
+The sampling kernels are plain functions over the permutation table so they
+can be JIT-compiled with Numba when it is installed (see utils.jit);
+noise2d_kernel exposes the scalar one to other compiled kernels.
 """
 
+import math
 import numpy as np
 
+from utils.jit import HAS_NUMBA, njit
+
+# Gradient directions indexed by hash % 8
+_GRAD_X = np.array([1, -1, 1, -1, 1, -1, 0, 0], dtype=float)
+_GRAD_Y = np.array([1, 1, -1, -1, 0, 0, 1, -1], dtype=float)
+
+
+@njit(cache=True, fastmath=True)
+def _noise2d_core(x, y, perm):
+    """2D Perlin noise at (x, y) for a doubled permutation table."""
+    x0 = math.floor(x)
+    y0 = math.floor(y)
+    xi = int(x0) & 255
+    yi = int(y0) & 255
+    xf = x - x0
+    yf = y - y0
+
+    u = xf * xf * xf * (xf * (xf * 6 - 15) + 10)
+    v = yf * yf * yf * (yf * (yf * 6 - 15) + 10)
+
+    aa = perm[perm[xi] + yi] % 8
+    ab = perm[perm[xi] + yi + 1] % 8
+    ba = perm[perm[xi + 1] + yi] % 8
+    bb = perm[perm[xi + 1] + yi + 1] % 8
+
+    n00 = _GRAD_X[aa] * xf + _GRAD_Y[aa] * yf
+    n10 = _GRAD_X[ba] * (xf - 1) + _GRAD_Y[ba] * yf
+    n01 = _GRAD_X[ab] * xf + _GRAD_Y[ab] * (yf - 1)
+    n11 = _GRAD_X[bb] * (xf - 1) + _GRAD_Y[bb] * (yf - 1)
+
+    x1 = n00 + u * (n10 - n00)
+    x2 = n01 + u * (n11 - n01)
+    return x1 + v * (x2 - x1)
+
+
+@njit(cache=True, fastmath=True)
+def _octave_noise_core(x, y, octaves, persistence, perm):
+    """Sum of octaves of _noise2d_core, normalized by the total amplitude."""
+    total = 0.0
+    amplitude = 1.0
+    frequency = 1.0
+    max_value = 0.0
+
+    for _ in range(octaves):
+        total += _noise2d_core(x * frequency, y * frequency, perm) * amplitude
+        max_value += amplitude
+        amplitude *= persistence
+        frequency *= 2.0
+
+    return total / max_value
+
+
+# Public scalar kernel for other compiled code: noise2d_kernel(x, y, perm)
+# with perm from PerlinNoise.perm; equal to PerlinNoise.noise2d
+noise2d_kernel = _noise2d_core
+
+
+@njit(cache=True, fastmath=True)
+def _octave_noise_batch(xs, ys, octaves, persistence, perm, out):
+    """Fill out[i] with octave noise at (xs[i], ys[i])."""
+    for i in range(xs.shape[0]):
+        out[i] = _octave_noise_core(xs[i], ys[i], octaves, persistence, perm)
+
 
 class PerlinNoise:
     """CPU-efficient Perlin noise generator for procedural animation."""
 
+    # Generators handed out by shared(), one per seed
+    _instances = {}
+
     def __init__(self, seed=0):
         rng = np.random.RandomState(seed)
-        self.p = np.arange(256, dtype=int)
-        rng.shuffle(self.p)
-        self.p = np.tile(self.p, 2)
+        perm = np.arange(256, dtype=np.int32)
+        rng.shuffle(perm)
+        # Doubled so lookups never need to wrap; never written after this
+        self.p = np.ascontiguousarray(np.tile(perm, 2))
+        self.p.flags.writeable = False
+
+    @classmethod
+    def shared(cls, seed=0):
+        """Process-wide generator for seed, so skins with a fixed seed share one table."""
+        inst = cls._instances.get(seed)
+        if inst is None:
+            inst = cls._instances[seed] = cls(seed)
+        return inst
+
+    @property
+    def perm(self):
+        """Read-only permutation table to pass to noise2d_kernel."""
+        return self.p
 
     @staticmethod
     def _fade(t):
@@ -23,44 +109,68 @@ class PerlinNoise:
     def _lerp(a, b, t):
         return a + t * (b - a)
 
-    @staticmethod
-    def _grad(h, x, y):
-        vectors = [(1, 1), (-1, 1), (1, -1), (-1, -1),
-                   (1, 0), (-1, 0), (0, 1), (0, -1)]
-        g = vectors[h % 8]
-        return g[0] * x + g[1] * y
-
     def noise2d(self, x, y):
         """Generate 2D Perlin noise value at (x, y). Returns value in [-1, 1]."""
-        xi = int(np.floor(x)) & 255
-        yi = int(np.floor(y)) & 255
-        xf = x - np.floor(x)
-        yf = y - np.floor(y)
+        return float(_noise2d_core(float(x), float(y), self.p))
+
+    def octave_noise(self, x, y, octaves=3, persistence=0.5):
+        """Multi-octave Perlin noise for richer organic motion."""
+        return float(_octave_noise_core(float(x), float(y), octaves, persistence, self.p))
+
+    def noise2d_array(self, xs, ys):
+        """Vectorized noise2d over arrays (or scalars) of coordinates."""
+        if HAS_NUMBA:
+            return self._octave_noise_jit(xs, ys, 1, 1.0)
+
+        xs, ys = np.broadcast_arrays(np.asarray(xs, dtype=float), np.asarray(ys, dtype=float))
+        x0 = np.floor(xs)
+        y0 = np.floor(ys)
+        xi = x0.astype(int) & 255
+        yi = y0.astype(int) & 255
+        xf = xs - x0
+        yf = ys - y0
 
         u = self._fade(xf)
         v = self._fade(yf)
 
-        aa = self.p[self.p[xi] + yi]
-        ab = self.p[self.p[xi] + yi + 1]
-        ba = self.p[self.p[xi + 1] + yi]
-        bb = self.p[self.p[xi + 1] + yi + 1]
+        p = self.p
+        pa = p[xi] + yi
+        pb = p[xi + 1] + yi
+        aa = p[pa] % 8
+        ab = p[pa + 1] % 8
+        ba = p[pb] % 8
+        bb = p[pb + 1] % 8
 
-        x1 = self._lerp(self._grad(aa, xf, yf), self._grad(ba, xf - 1, yf), u)
-        x2 = self._lerp(self._grad(ab, xf, yf - 1), self._grad(bb, xf - 1, yf - 1), u)
+        x1 = self._lerp(_GRAD_X[aa] * xf + _GRAD_Y[aa] * yf,
+                        _GRAD_X[ba] * (xf - 1) + _GRAD_Y[ba] * yf, u)
+        x2 = self._lerp(_GRAD_X[ab] * xf + _GRAD_Y[ab] * (yf - 1),
+                        _GRAD_X[bb] * (xf - 1) + _GRAD_Y[bb] * (yf - 1), u)
 
         return self._lerp(x1, x2, v)
 
-    def octave_noise(self, x, y, octaves=3, persistence=0.5):
-        """Multi-octave Perlin noise for richer organic motion."""
+    def octave_noise_array(self, xs, ys, octaves=3, persistence=0.5):
+        """Vectorized octave_noise over arrays (or scalars) of coordinates."""
+        if HAS_NUMBA:
+            return self._octave_noise_jit(xs, ys, octaves, persistence)
+
+        xs = np.asarray(xs, dtype=float)
+        ys = np.asarray(ys, dtype=float)
         total = 0.0
         amplitude = 1.0
         frequency = 1.0
         max_value = 0.0
 
         for _ in range(octaves):
-            total += self.noise2d(x * frequency, y * frequency) * amplitude
+            total = total + self.noise2d_array(xs * frequency, ys * frequency) * amplitude
             max_value += amplitude
             amplitude *= persistence
             frequency *= 2.0
 
         return total / max_value
+
+    def _octave_noise_jit(self, xs, ys, octaves, persistence):
+        """Compiled batch path shared by the *_array methods."""
+        xs, ys = np.broadcast_arrays(np.asarray(xs, dtype=float), np.asarray(ys, dtype=float))
+        out = np.empty(xs.shape)
+        _octave_noise_batch(xs.ravel(), ys.ravel(), octaves, float(persistence), self.p, out.ravel())
+        return out
@@ -0,0 +1,247 @@
+"""Tests for the jellyfish renderers."""
+import math
+import sys
+import pytest
+
+pytest.importorskip("PySide6.QtWidgets", exc_type=ImportError)
+from PySide6.QtWidgets import QApplication
+
+from ui.jellyfish_iridescent_skin import IridescentJellyfish, MAX_LIGHT_PARTICLES
+from ui.jellyfish_skin import BioluminescentJellyfishSkin, BELL_CONTRACTION_BUCKETS
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    app = QApplication.instance() or QApplication(sys.argv)
+    return app
+
+
+def _make_jelly_state(x=100, y=100, vx=20, vy=5):
+    return {
+        "position": [x, y],
+        "velocity": [vx, vy],
+        "mood": 80,
+        "facing_angle": 0.0,
+        "dt": 0.033,
+    }
+
+
+def _render_jelly(skin, frames=1, state=None):
+    from PySide6.QtGui import QPainter, QPixmap
+    pixmap = QPixmap(300, 400)
+    pixmap.fill()
+    painter = QPainter(pixmap)
+    for _ in range(frames):
+        skin.render(painter, (150, 120), state or _make_jelly_state(150, 120))
+    painter.end()
+
+
+# --- Bioluminescent Jellyfish Tests ---
+
+def test_jelly_render(qapp):
+    skin = BioluminescentJellyfishSkin()
+    _render_jelly(skin)
+
+
+def test_jelly_render_flash(qapp):
+    skin = BioluminescentJellyfishSkin()
+    skin.trigger_flash()
+    _render_jelly(skin, frames=5)
+
+
+def test_jelly_bell_paths_cached_per_bucket(qapp):
+    skin = BioluminescentJellyfishSkin()
+    _render_jelly(skin, frames=120)
+    assert 0 < len(skin._bell_path_cache) <= BELL_CONTRACTION_BUCKETS
+
+
+def test_jelly_shape_cache_resets_on_radius_change(qapp):
+    skin = BioluminescentJellyfishSkin()
+    _render_jelly(skin)
+    assert skin._groove_path is not None
+    skin.bell_radius = 50
+    skin._sync_shape_cache()
+    assert skin._bell_path_cache == {}
+    assert skin._groove_path is None
+    assert len(skin._bell_sprites) == 0
+
+
+def test_jelly_bell_sprites_reused(qapp):
+    from ui.jellyfish_skin import BELL_SPRITE_BUCKETS, BELL_SPRITE_GLOW_BUCKETS
+    skin = BioluminescentJellyfishSkin()
+    _render_jelly(skin, frames=200)
+    assert 0 < len(skin._bell_sprites) <= BELL_SPRITE_BUCKETS * BELL_SPRITE_GLOW_BUCKETS
+    assert len(skin._bell_sprites) < 200
+
+
+def test_jelly_bell_sprite_baked_at_device_pixel_ratio(qapp):
+    from PySide6.QtGui import QImage, QPainter
+    from ui.jellyfish_skin import BELL_SPRITE_EXTENT
+    skin = BioluminescentJellyfishSkin()
+    image = QImage(600, 800, QImage.Format_ARGB32_Premultiplied)
+    image.setDevicePixelRatio(2)
+    image.fill(0)
+    painter = QPainter(image)
+    try:
+        skin.render(painter, (150, 120), _make_jelly_state(150, 120))
+    finally:
+        painter.end()
+    # One logical unit covers two device pixels, so the sprite must too
+    device_size = 2 * skin.bell_radius * BELL_SPRITE_EXTENT * 2
+    assert [sprite.width() >= device_size for sprite in skin._bell_sprites.values()] == [True]
+
+
+def test_jelly_plain_bell_sprites_ignore_glow(qapp):
+    from ui.jellyfish_skin import LOD_DETAIL_SCALE
+    skin = BioluminescentJellyfishSkin()
+    skin.size_scale = LOD_DETAIL_SCALE * 0.9
+    skin.pulse_phase = math.pi / 2
+    state = dict(_make_jelly_state(150, 120), dt=0.0)  # Hold the bell still
+    skin.trigger_flash()
+    for glow in (0.2, 0.5, 1.0):
+        skin.flash_timer = 1.0 - glow  # Flash glow level, frozen while dt is 0
+        _render_jelly(skin, state=state)
+    assert len(skin._bell_sprites) == 1
+
+
+def test_jelly_animation_follows_dt(qapp):
+    skin = BioluminescentJellyfishSkin()
+    _render_jelly(skin)
+    assert skin.time == pytest.approx(0.033)
+    # A second sector drawing the same tick advances nothing
+    still = dict(_make_jelly_state(150, 120), dt=0.0)
+    _render_jelly(skin, state=still)
+    assert skin.time == pytest.approx(0.033)
+
+
+def test_jelly_full_tentacle_resolution_only_during_flash(qapp):
+    from ui.jellyfish_skin import AMBIENT_TENTACLE_SEGMENTS, TENTACLE_SEGMENTS
+    skin = BioluminescentJellyfishSkin()
+    _render_jelly(skin)
+    assert skin._tentacle_segments == AMBIENT_TENTACLE_SEGMENTS
+    skin.trigger_flash()
+    _render_jelly(skin)
+    assert skin._tentacle_segments == TENTACLE_SEGMENTS
+
+
+# --- Iridescent Jellyfish Tests ---
+
+def test_iridescent_flash_fills_particle_pool(qapp):
+    jelly = IridescentJellyfish(config=None)
+    jelly.trigger_flash()
+    assert int(jelly.p_alive.sum()) == 30
+    assert len(jelly._free_stack) == MAX_LIGHT_PARTICLES - 30
+
+
+def test_iridescent_dead_particles_return_to_pool(qapp):
+    jelly = IridescentJellyfish(config=None)
+    jelly.trigger_flash()
+    for _ in range(200):
+        jelly.update_state(0.033, jelly.x, jelly.y)
+    assert len(jelly._free_stack) + int(jelly.p_alive.sum()) == MAX_LIGHT_PARTICLES
+    assert not (jelly.p_alive & (jelly.p_life <= 0)).any()
+
+
+def test_iridescent_pool_overflow_is_dropped(qapp):
+    jelly = IridescentJellyfish(config=None)
+    for _ in range(MAX_LIGHT_PARTICLES // 30 + 2):
+        jelly.trigger_flash()
+    assert int(jelly.p_alive.sum()) == MAX_LIGHT_PARTICLES
+    assert jelly._free_stack == []
+
+
+def test_iridescent_hsv_lut_matches_qt(qapp):
+    from PySide6.QtGui import QColor
+    from ui.jellyfish_iridescent_skin import HSV_LUT_SATS, _lut_color
+    for hue in range(0, 360, 7):
+        for sat in HSV_LUT_SATS:
+            a = _lut_color(hue, sat, 90)
+            b = QColor.fromHsv(hue, sat, 255, 90)
+            assert abs(a.red() - b.red()) <= 1
+            assert abs(a.green() - b.green()) <= 1
+            assert abs(a.blue() - b.blue()) <= 1
+            assert a.alpha() == 90
+
+
+def test_iridescent_particle_brushes_ignore_fade(qapp):
+    from PySide6.QtGui import QPainter, QPixmap
+    jelly = IridescentJellyfish(config=None)
+    jelly.trigger_flash()
+    pixmap = QPixmap(300, 350)
+    painter = QPainter(pixmap)
+    try:
+        jelly._draw_light_particles(painter)
+        brushes = len(jelly._particle_brush_cache)
+        # Fading and pulsing only change the draw opacity, not the brush
+        jelly.p_life *= 0.5
+        jelly.p_phase += 1.0
+        jelly._draw_light_particles(painter)
+        assert painter.opacity() == 1.0
+    finally:
+        painter.end()
+    assert brushes > 0
+    assert len(jelly._particle_brush_cache) == brushes
+
+
+def test_iridescent_paint(qapp):
+    from PySide6.QtGui import QPixmap
+    jelly = IridescentJellyfish(config=None)
+    jelly.show()
+    jelly.trigger_flash()
+    jelly.update_state(0.033, jelly.x, jelly.y)
+    pixmap = QPixmap(300, 350)
+    jelly.render(pixmap)
+    jelly.hide()
+
+
+def test_iridescent_faded_flash_rings_are_dropped(qapp):
+    jelly = IridescentJellyfish(config=None)
+    jelly.trigger_flash()
+    assert len(jelly.flash_rings) == 3
+    for _ in range(60):
+        jelly.update_state(0.033, jelly.x, jelly.y)
+    assert jelly.flash_rings == []
+
+
+def test_iridescent_pool_high_water_mark_shrinks(qapp):
+    jelly = IridescentJellyfish(config=None)
+    jelly.trigger_flash()
+    assert jelly._p_high == 30
+    jelly.p_life[:] = 0.0
+    jelly.update_state(0.033, jelly.x, jelly.y)
+    # At most one new particle may have been emitted, into the lowest slot
+    assert jelly._p_high <= 1
+
+
+def test_jelly_low_detail_render(qapp, monkeypatch):
+    from ui.jellyfish_skin import LOD_CULL_SCALE
+    skin = BioluminescentJellyfishSkin()
+    glows = []
+    monkeypatch.setattr(skin, "_draw_bioluminescent_glow", glows.append)
+    skin.size_scale = LOD_CULL_SCALE / 2
+    # Run long enough for the ambient glow pulse to cover its whole range
+    _render_jelly(skin, frames=100)
+    assert skin.lod < LOD_CULL_SCALE
+    assert glows == []
+    skin.trigger_flash()
+    _render_jelly(skin, frames=3)
+    assert len(glows) == 3
+
+
+def test_jelly_tentacle_kernels_fill_buffers():
+    import numpy as np
+    from ui.jellyfish_skin import (
+        _compute_tentacles, _compute_trailing, _SEGMENT_T, TENTACLE_SEGMENTS, TRAILING_SEGMENTS
+    )
+    tent_t = _SEGMENT_T[TENTACLE_SEGMENTS]
+    trail_t = _SEGMENT_T[TRAILING_SEGMENTS]
+    n = 10
+    pts = np.empty((n, len(tent_t), 2))
+    _compute_tentacles(tent_t, np.zeros(n), np.arange(n, dtype=float),
+                       np.zeros(n), np.full(n, 80.0), pts)
+    # Zero phase: roots at the start positions, tips hang straight down by length
+    assert np.allclose(pts[:, 0, 0], np.arange(n))
+    assert np.allclose(pts[:, -1, 1], 80.0)
+    trail = np.empty((len(trail_t), 2))
+    _compute_trailing(trail_t, 0.0, 0.0, 1.0, 2.0, 200.0, trail)
+    assert np.allclose(trail[0], (1.0, 2.0))
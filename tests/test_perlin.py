@@ -30,3 +30,29 @@ def test_perlin_octave():
     pn = PerlinNoise(seed=42)
     val = pn.octave_noise(1.0, 2.0, octaves=3)
     assert -1.5 <= val <= 1.5
+
+
+def test_perlin_array_matches_scalar():
+    import numpy as np
+    pn = PerlinNoise(seed=42)
+    xs = np.linspace(-3.0, 300.0, 57)
+    ys = np.linspace(0.1, 7.9, 57)
+    assert np.allclose(pn.noise2d_array(xs, ys), [pn.noise2d(x, y) for x, y in zip(xs, ys)])
+    assert np.allclose(pn.octave_noise_array(xs, 1.5, octaves=3),
+                       [pn.octave_noise(x, 1.5, octaves=3) for x in xs])
+
+
+def test_perlin_shared_per_seed():
+    shared = PerlinNoise.shared(42)
+    assert PerlinNoise.shared(42) is shared
+    assert PerlinNoise.shared(137) is not shared
+    assert not shared.p.flags.writeable
+    assert shared.noise2d(1.3, 0.7) == PerlinNoise(seed=42).noise2d(1.3, 0.7)
+
+
+def test_perlin_kernel_matches_noise2d():
+    from engine.perlin import noise2d_kernel
+    pn = PerlinNoise(seed=7)
+    assert not pn.perm.flags.writeable
+    for x, y in ((0.3, 1.7), (-4.2, 9.9), (123.5, -0.25)):
+        assert noise2d_kernel(x, y, pn.perm) == pn.noise2d(x, y)
@@ -0,0 +1,37 @@
+from ui.render_cache import LRUCache
+
+
+def test_lru_get_and_put():
+    cache = LRUCache(maxsize=4)
+    assert cache.get("a") is None
+    assert cache.put("a", 1) == 1
+    assert cache.get("a") == 1
+    assert "a" in cache
+    assert len(cache) == 1
+
+
+def test_lru_evicts_oldest():
+    cache = LRUCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.put("c", 3)
+    assert "a" not in cache
+    assert cache.get("b") == 2
+    assert cache.get("c") == 3
+
+
+def test_lru_get_refreshes_entry():
+    cache = LRUCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.put("c", 3)
+    assert "a" in cache
+    assert "b" not in cache
+
+
+def test_lru_clear():
+    cache = LRUCache(maxsize=2)
+    cache.put("a", 1)
+    cache.clear()
+    assert len(cache) == 0
@@ -6,6 +6,7 @@ import math
 pytest.importorskip("PySide6.QtWidgets", exc_type=ImportError)
 from PySide6.QtWidgets import QApplication
 pytest.importorskip("PySide6.QtGui", exc_type=ImportError)
+from PySide6.QtGui import QImage, QPainter
 
 from ui.tetra_skin import NeonTetraSkin
 from ui.discus_skin import DiscusSkin
@@ -18,6 +19,16 @@ def qapp():
     return app
 
 
+@pytest.fixture
+def painter(qapp):
+    """Active painter on a white 200x200 image (painter.device()), ended on teardown."""
+    image = QImage(200, 200, QImage.Format_ARGB32_Premultiplied)
+    image.fill(0xFFFFFFFF)
+    active = QPainter(image)
+    yield active
+    active.end()
+
+
 def _make_fish_state(x=100, y=100, vx=20, vy=5):
     return {
         "position": [x, y],
@@ -253,3 +264,257 @@ def test_betta_eye_tracking_damping_smooths_offsets():
     assert x2 < 0.9
     assert y1 == pytest.approx(0.0)
     assert y2 == pytest.approx(0.0)
+
+
+def test_betta_render(painter):
+    skin = FishSkin()
+    image = painter.device()
+    blank = image.copy()
+    skin.render(painter, (100, 100), _make_fish_state(vx=20))
+    assert image != blank
+    assert not skin._facing_left
+    facing_right = image.copy()
+    image.fill(0xFFFFFFFF)
+    skin.render(painter, (100, 100), _make_fish_state(vx=-20))
+    assert skin._facing_left
+    assert image != facing_right
+
+
+def test_betta_color_table_matches_shifted_color():
+    skin = FishSkin()
+    skin.color_shift_phase = 1.3
+    skin.turn_intensity = 0.6
+    skin.swim_cadence = 1.2
+    expected = {
+        (name, offset): skin._shifted_color(getattr(skin, name), offset)
+        for name, offset in (("primary", 0.0), ("secondary", 2.0), ("accent", 2.5))
+    }
+    skin._frame_colors = skin._compute_color_table()
+    for (name, offset), rgb in expected.items():
+        assert skin._shifted_color(getattr(skin, name), offset) == rgb
+
+
+def test_betta_make_color_reuses_qcolor():
+    skin = FishSkin()
+    first = skin._make_color([30, 80, 220], 200)
+    assert skin._make_color([30, 80, 220], 200) is first
+    assert first.alpha() == int(200 * skin.opacity)
+    assert skin._make_color([300, -5, 10], 999).getRgb() == (255, 0, 10, 255)
+
+
+def test_betta_layer_outlines_scale_toward_pivot():
+    import numpy as np
+    from ui.skin import _layer_outlines
+    xs = np.array([0.0, 1.0, 2.0])
+    ys = np.array([-11.0, -31.0, -11.0])
+    out = _layer_outlines(xs, ys, -11.0, np.array([1.0, 0.5]))
+    assert out.shape == (2, 3, 2)
+    assert np.allclose(out[:, :, 0], xs)
+    assert np.allclose(out[1, :, 1], [-11.0, -21.0, -11.0])
+
+
+def test_betta_polygon_copies_array_points():
+    import numpy as np
+    from ui.skin import _polygon
+    points = np.array([[0.5, -1.0], [2.0, 3.25], [-4.0, 0.0]])
+    polygon = _polygon(points[::-1])
+    assert [(p.x(), p.y()) for p in polygon] == [(-4.0, 0.0), (2.0, 3.25), (0.5, -1.0)]
+    assert _polygon(np.empty((0, 2))).isEmpty()
+
+
+def test_betta_polygon_fallback_without_direct_fill(monkeypatch):
+    import numpy as np
+    import ui.skin
+    monkeypatch.setattr(ui.skin, "_DIRECT_POLYGON_FILL", False)
+    polygon = ui.skin._polygon(np.array([[0.5, -1.0], [2.0, 3.25]]))
+    assert [(p.x(), p.y()) for p in polygon] == [(0.5, -1.0), (2.0, 3.25)]
+
+
+def test_betta_offscreen_render_skips_drawing_but_animates(painter):
+    skin = FishSkin()
+    before = painter.device().copy()
+    skin.render(painter, (5000, 5000), _make_fish_state(vx=20))
+    assert skin.time > 0.0
+    assert painter.device() == before
+
+
+def test_betta_fin_geometry_kernel_fills_buffers():
+    import numpy as np
+    from ui.skin import (
+        _compute_fin_geometry, _FIN_NOISE_X, _CAUDAL_CENTER_NOISE_X,
+        CAUDAL_RAYS, DORSAL_POINTS, ANAL_POINTS, VENTRAL_POINTS,
+    )
+    caudal = np.full((3, CAUDAL_RAYS), np.nan)
+    dorsal = np.full(DORSAL_POINTS + 1, np.nan)
+    anal = np.full(ANAL_POINTS + 1, np.nan)
+    ventral = np.full((2, VENTRAL_POINTS), np.nan)
+    _compute_fin_geometry(0.0, 0.0, 0.0, 1.0, 0.0, 0.0,
+                          np.zeros_like(_FIN_NOISE_X), np.zeros_like(_CAUDAL_CENTER_NOISE_X),
+                          caudal, dorsal, anal, ventral)
+    for buf in (caudal, dorsal, anal, ventral):
+        assert np.isfinite(buf).all()
+    # No tail amplitude and no noise: the caudal center line stays on the axis
+    assert np.allclose(caudal[2], 0.0)
+    # Upper ventral fin hangs above the body, lower one below
+    assert (ventral[0] < 0).all() and (ventral[1] > 0).all()
+
+
+def test_betta_gradient_brushes_reused_when_unchanged(painter):
+    skin = FishSkin()
+    skin.render(painter, (100, 100), _make_fish_state(vx=20))
+    cheek = skin._gradient_brushes["cheek"][1]
+    skin.render(painter, (100, 100), _make_fish_state(vx=20))
+    assert skin._gradient_brushes["cheek"][1] is cheek
+
+
+def test_betta_pen_cache_shares_pens():
+    skin = FishSkin()
+    pen = skin._pen([255, 255, 255], 20, 0.35)
+    assert skin._pen([255, 255, 255], 20, 0.35) is pen
+    assert pen.widthF() == 0.35
+    assert skin._pen([255, 255, 255], 20, 0.5) is not pen
+
+
+def test_betta_palette_blends_follow_palette(painter):
+    skin = FishSkin()
+    blends = skin._palette_blends
+    assert blends["rim"] == skin._lerp_color(skin.accent, [255, 255, 255], 0.45)
+    skin.render(painter, (100, 100), _make_fish_state())
+    assert skin._palette_blends is blends  # Unchanged palette, nothing rederived
+    skin.set_colors([10, 20, 30], [40, 50, 60], [200, 100, 0])
+    skin.render(painter, (100, 100), _make_fish_state())
+    assert skin._palette_blends["eye_ring"] == [5, 10, 15]
+
+
+def test_betta_body_paths_cached_per_flex_step(painter):
+    skin = FishSkin()
+    for _ in range(120):
+        skin.render(painter, (100, 100), _make_fish_state())
+    assert 0 < len(skin._body_path_cache) < 120
+    skin.body_flex = 1.01
+    assert skin._body_paths() is skin._body_paths()
+
+
+def test_betta_paint_does_not_advance(painter):
+    skin = FishSkin()
+    skin.advance(_make_fish_state())
+    assert skin.time == pytest.approx(0.033)
+    phase = skin.tail_phase
+    skin.paint(painter, (100, 100), _make_fish_state())
+    skin.paint(painter, (100, 100), _make_fish_state())
+    assert skin.time == pytest.approx(0.033)
+    assert skin.tail_phase == phase
+
+
+def test_betta_eye_reuses_iris_pen(painter):
+    skin = FishSkin()
+    pen = skin._iris_line_pen
+    skin.render(painter, (100, 100), _make_fish_state())
+    skin.render(painter, (100, 100), _make_fish_state())
+    assert skin._iris_line_pen is pen
+    assert pen.color().alpha() == 30
+
+
+def test_betta_iris_gradient_cached_per_stress_step(qapp):
+    from ui.skin import EYE_STRESS_STEPS
+    skin = FishSkin()
+    brush, rgb = skin._iris_style(0)
+    assert skin._iris_style(0)[0] is brush
+    assert rgb == [20, 35, 90]
+    assert skin._iris_style(EYE_STRESS_STEPS)[1] == [170, 55, 25]
+
+
+def test_betta_eye_sprites_per_palette_and_resolution(painter):
+    skin = FishSkin()
+    for _ in range(5):
+        skin.render(painter, (100, 100), _make_fish_state())
+    assert len(skin._eye_sprites) == 1
+    assert len(skin._glint_sprites) == 1
+    sprite = skin._eye_sprite(1)
+    painter.scale(1.5, 1.5)  # Baked at the next power of two
+    skin.render(painter, (60, 60), _make_fish_state())
+    assert len(skin._eye_sprites) == 2
+    assert len(skin._glint_sprites) == 2
+    assert skin._eye_sprite(2).width() == 2 * sprite.width()
+
+
+def test_betta_eye_sprites_baked_at_device_pixel_ratio(qapp):
+    from ui.skin import _EYE_SPRITE_RECT
+    skin = FishSkin()
+    image = QImage(400, 400, QImage.Format_ARGB32_Premultiplied)
+    image.setDevicePixelRatio(2)
+    image.fill(0)
+    painter = QPainter(image)
+    try:
+        skin.render(painter, (100, 100), _make_fish_state())
+        assert skin._sprite_resolution(painter) == 2
+    finally:
+        painter.end()
+    assert [sprite.width() for sprite in skin._eye_sprites.values()] == [2 * _EYE_SPRITE_RECT.width()]
+
+
+def test_betta_small_eye_drops_detail(painter):
+    from ui.skin import EYE_R, LOD_EYE_DETAIL_RADIUS, LOD_EYE_FLAT_RADIUS
+    tiny = FishSkin()
+    tiny.size_scale = LOD_EYE_FLAT_RADIUS / EYE_R / 2
+    tiny.render(painter, (100, 100), _make_fish_state())
+    assert len(tiny._iris_brushes) == 0  # Flat dot, no iris at all
+    small = FishSkin()
+    small.size_scale = (LOD_EYE_FLAT_RADIUS + LOD_EYE_DETAIL_RADIUS) / 2 / EYE_R
+    small.render(painter, (100, 100), _make_fish_state())
+    assert len(small._iris_brushes) == 1
+    assert small._iris_line_rgb is None  # Iris texture skipped
+
+
+def test_betta_invisible_glow_is_skipped(painter):
+    skin = FishSkin()
+    skin.render(painter, (100, 100), dict(_make_fish_state(), mood=0))
+    assert len(skin._glow_sprites) == 0
+    skin.render(painter, (100, 100), _make_fish_state())
+    assert len(skin._glow_sprites) == 1
+
+
+def test_betta_fine_details_antialiased_only_when_large(painter):
+    from ui.skin import LOD_AA_DETAIL_SCALE
+    skin = FishSkin()
+    skin.render(painter, (100, 100), _make_fish_state())
+    assert skin.lod == pytest.approx(1.0)
+    assert not skin._smooth_details
+    painter.scale(2.0, 2.0)
+    skin.render(painter, (50, 50), _make_fish_state())
+    assert skin.lod > LOD_AA_DETAIL_SCALE
+    assert skin._smooth_details
+
+
+def test_betta_static_parts_shared_between_fish():
+    a = FishSkin()
+    b = FishSkin()
+    assert a._scale_paths is b._scale_paths
+    assert a._highlight_path is b._highlight_path
+
+
+def test_betta_irid_lut_matches_direct_colors(qapp):
+    import numpy as np
+    from ui.skin import _IRID_EDGES
+    skin = FishSkin()
+    skin.primary = [210, 40, 90]
+    skin._derive_palette()
+    shifts = np.random.RandomState(0).uniform(-2.5, 2.5, 5000)
+    looked_up = np.array(skin._irid_lut)[np.searchsorted(_IRID_EDGES, shifts)]
+    assert (looked_up == skin._irid_colors(shifts)).all()
+
+
+def test_betta_scale_fill_kernel_matches_vectorized_path():
+    import numpy as np
+    from ui.skin import (
+        _compute_scale_fills, _IRID_EDGES, _SCALE_IRID_X, _SCALE_IRID_Y,
+        _SCALE_SHIMMER_X, _SCALE_SHIMMER_Y, SCALE_ALPHA_MASK,
+    )
+    skin = FishSkin()
+    fills = np.empty(len(_SCALE_IRID_X), dtype=np.int64)
+    for t in np.linspace(0.0, 40.0, 50):
+        _compute_scale_fills(t, 20.0, skin.perlin.perm, skin.perlin2.perm, fills)
+        shimmers = skin.perlin.noise2d_array(_SCALE_SHIMMER_X + t * 0.8, _SCALE_SHIMMER_Y + t * 0.3)
+        shifts = skin.perlin2.noise2d_array(_SCALE_IRID_X, _SCALE_IRID_Y + t * 0.5)
+        alphas = np.clip((20.0 + shimmers * 25).astype(int), 0, 60) & ~SCALE_ALPHA_MASK
+        assert (fills == (np.searchsorted(_IRID_EDGES, shifts) << 6 | alphas)).all()
@@ -4,36 +4,92 @@ Rainbow-shifting opalescent body with realistic deep sea light effects
 Inspired by Atolla wyvillei and deep sea comb jellies
 """
 
+import colorsys
 import math
 import random
 from typing import List, Tuple
-from dataclasses import dataclass, field
-from PySide6.QtCore import Qt, QPointF
+from dataclasses import dataclass
+import numpy as np
+from PySide6.QtCore import Qt, QPointF, QRectF
 from PySide6.QtGui import (
     QPainter, QPainterPath, QColor, QLinearGradient, 
-    QRadialGradient, QConicalGradient, QPen, QBrush
+    QRadialGradient, QConicalGradient, QPen, QBrush, QPixmap
 )
 from PySide6.QtWidgets import QWidget
 
+from ui.render_cache import LRUCache
 
-@dataclass
-class LightParticle:
-    """Bioluminescent light particle drifting in water"""
-    x: float
-    y: float
-    vx: float
-    vy: float
-    size: float
-    hue: float
-    life: float = 1.0
-    pulse_phase: float = 0.0
-    
-    def update(self, dt: float):
-        self.x += self.vx * dt
-        self.y += self.vy * dt
-        self.vy -= 5 * dt  # Rise up
-        self.life -= dt * 0.3
-        self.pulse_phase += dt * 3
+# Capacity of the light particle pool (slots are recycled, never reallocated)
+MAX_LIGHT_PARTICLES = 256
+
+# Shared constants for gradient end stops and pen resets
+_TRANSPARENT = QColor(0, 0, 0, 0)
+_CLEAR_WHITE = QColor(255, 255, 255, 0)
+_NO_PEN = Qt.PenStyle.NoPen
+
+# Rainbow iridescent stops for the bell body (alpha 180)
+BELL_RAINBOW = [
+    (0.0, (150, 100, 255)),    # Purple
+    (0.15, (100, 150, 255)),   # Blue
+    (0.3, (100, 255, 200)),    # Cyan
+    (0.45, (150, 255, 150)),   # Green
+    (0.6, (255, 255, 100)),    # Yellow
+    (0.75, (255, 150, 100)),   # Orange
+    (0.9, (255, 100, 150)),    # Pink
+    (1.0, (150, 100, 255)),    # Purple
+]
+
+# Marginal lappet layout along the bell rim (constant; only the ruffle animates)
+NUM_LAPPETS = 16
+_LAPPET_IDX = np.arange(NUM_LAPPETS + 1)
+_LAPPET_COS = np.cos(math.pi - math.pi * _LAPPET_IDX / NUM_LAPPETS)
+_LAPPET_CP_COS = np.cos(math.pi - math.pi * (_LAPPET_IDX[1:] - 0.5) / NUM_LAPPETS)
+
+# HSV -> RGB table (full value) for the saturations this skin draws with.
+# A table lookup plus the plain RGBA constructor replaces QColor.fromHsv.
+HSV_LUT_SATS = (100, 150, 180, 200)
+_HSV_LUT = np.array([
+    [[round(c * 255) for c in colorsys.hsv_to_rgb(h / 360, sat / 255, 1.0)]
+     for sat in HSV_LUT_SATS]
+    for h in range(360)
+], dtype=np.uint8)
+_HSV_RGB = _HSV_LUT.tolist()  # nested lists for fast scalar lookups
+_SAT_INDEX = {sat: k for k, sat in enumerate(HSV_LUT_SATS)}
+
+
+def _lut_color(hue: float, sat: int, alpha: int = 255) -> QColor:
+    """QColor for (hue, sat, value=255, alpha) via the precomputed table"""
+    r, g, b = _HSV_RGB[int(hue) % 360][_SAT_INDEX[sat]]
+    return QColor(r, g, b, alpha)
+
+
+# Particle glow: three soft layers (radius in particle sizes, alpha weight)
+# stacked into one radial gradient with stops where the layer profiles bend
+PARTICLE_GLOW_LAYERS = ((2.0, 0.5), (2.8, 0.35), (3.6, 0.2))
+PARTICLE_GLOW_EXTENT = 3.6
+PARTICLE_GLOW_STOPS = (0.0, 1.0, 2.0, 2.8, 3.6)
+# Brushes are baked at the brightest particle alpha (full life, pulse peak);
+# dimmer particles are drawn at a fraction of it through painter opacity
+PARTICLE_PEAK_ALPHA = 200
+
+# Bell size at bell_pulse == 1.0; the outer glow sprite is baked at this size
+BELL_W = 70
+BELL_H = 55
+
+# Fixed angular layouts of the radial canals and crown lights. Only a shared
+# rotation changes per frame, applied with the angle-sum identity.
+NUM_CANALS = 8
+_CANAL_IDX = np.arange(NUM_CANALS)
+_CANAL_COS = np.cos(_CANAL_IDX * 2 * math.pi / NUM_CANALS)
+_CANAL_SIN = np.sin(_CANAL_IDX * 2 * math.pi / NUM_CANALS)
+
+NUM_CROWN_LIGHTS = 6
+_CROWN_IDX = np.arange(NUM_CROWN_LIGHTS)
+_CROWN_COS = np.cos(_CROWN_IDX * 2 * math.pi / NUM_CROWN_LIGHTS)
+_CROWN_SIN = np.sin(_CROWN_IDX * 2 * math.pi / NUM_CROWN_LIGHTS)
+
+# Tentacles are stroked in this many hue/width/alpha bands from base to tip
+TENTACLE_BANDS = 6
 
 
 @dataclass
@@ -92,8 +148,18 @@ class IridescentJellyfish(QWidget):
         self.flash_intensity = 0.0
         self.flash_rings = []
         
+        # Light particle pool - structure-of-arrays, dead slots reused via free stack
+        self.p_xy = np.zeros((MAX_LIGHT_PARTICLES, 2), dtype=np.float32)
+        self.p_v = np.zeros((MAX_LIGHT_PARTICLES, 2), dtype=np.float32)
+        self.p_size = np.zeros(MAX_LIGHT_PARTICLES, dtype=np.float32)
+        self.p_hue = np.zeros(MAX_LIGHT_PARTICLES, dtype=np.float32)
+        self.p_life = np.zeros(MAX_LIGHT_PARTICLES, dtype=np.float32)
+        self.p_phase = np.zeros(MAX_LIGHT_PARTICLES, dtype=np.float32)
+        self.p_alive = np.zeros(MAX_LIGHT_PARTICLES, dtype=bool)
+        self._free_stack = list(range(MAX_LIGHT_PARTICLES - 1, -1, -1))
+        self._p_high = 0  # One past the highest live slot
+        
         # Collections
-        self.light_particles: List[LightParticle] = []
         self.tentacles: List[List[TentacleSegment]] = []
         self._init_tentacles()
         
@@ -101,9 +167,37 @@ class IridescentJellyfish(QWidget):
         self.base_hue = 260  # Purple base
         self.iridescent_shift = 0.0
         
+        # Quantized gradient brushes reused across paints
+        self._bell_brush_cache = LRUCache(maxsize=128)
+        self._particle_brush_cache = LRUCache(maxsize=256)
+        self._bell_glow_cache = LRUCache(maxsize=128)
+        self._color_cache = LRUCache(maxsize=512)
+        self._core_blob = self._make_core_blob()
+        
+        # Tentacle pens are mutated per segment rather than rebuilt
+        self._glow_pen = QPen(Qt.PenStyle.SolidLine)
+        self._glow_pen.setCapStyle(Qt.PenCapStyle.RoundCap)
+        self._glow_pen.setJoinStyle(Qt.PenJoinStyle.RoundJoin)
+        self._core_pen = QPen(Qt.PenStyle.SolidLine)
+        self._core_pen.setCapStyle(Qt.PenCapStyle.RoundCap)
+        self._core_pen.setJoinStyle(Qt.PenJoinStyle.RoundJoin)
+        
         self.resize(300, 350)
         self.move(int(self.x - 150), int(self.y - 175))
     
+    @staticmethod
+    def _make_core_blob() -> QPixmap:
+        """White crown-light core, rasterized once and scaled per light"""
+        blob = QPixmap(16, 16)
+        blob.fill(Qt.GlobalColor.transparent)
+        blob_painter = QPainter(blob)
+        blob_painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        blob_painter.setPen(_NO_PEN)
+        blob_painter.setBrush(QColor(255, 255, 255, 200))
+        blob_painter.drawEllipse(0, 0, 16, 16)
+        blob_painter.end()
+        return blob
+    
     def _init_tentacles(self):
         """Initialize tentacle segments"""
         # 8 marginal tentacles + 1 hypertrophied trailing tentacle
@@ -135,15 +229,15 @@ class IridescentJellyfish(QWidget):
             angle = random.uniform(0, math.pi * 2)
             speed = random.uniform(30, 80)
             hue = random.choice([200, 260, 280, 300, 320])  # Blue-purple-pink
-            self.light_particles.append(LightParticle(
-                x=self.x,
-                y=self.y,
-                vx=math.cos(angle) * speed,
-                vy=math.sin(angle) * speed - 20,
-                size=random.uniform(3, 8),
-                hue=hue,
-                life=1.5
-            ))
+            self._spawn_light_particle(
+                self.x,
+                self.y,
+                math.cos(angle) * speed,
+                math.sin(angle) * speed - 20,
+                random.uniform(3, 8),
+                hue,
+                1.5
+            )
     
     def update_state(self, dt: float, target_x: float, target_y: float):
         """Update jellyfish state"""
@@ -154,11 +248,12 @@ class IridescentJellyfish(QWidget):
         # Smooth movement toward target
         dx = target_x - self.x
         dy = target_y - self.y
-        dist = math.sqrt(dx*dx + dy*dy)
+        dist_sq = dx*dx + dy*dy
         
-        if dist > 10:
-            self.vx += (dx / dist) * 30 * dt
-            self.vy += (dy / dist) * 30 * dt
+        if dist_sq > 100:  # Farther than 10px
+            pull = 30 * dt / math.sqrt(dist_sq)
+            self.vx += dx * pull
+            self.vy += dy * pull
         
         # Gentle drift
         self.vx += math.sin(self.time * 0.5) * 5 * dt
@@ -184,18 +279,35 @@ class IridescentJellyfish(QWidget):
             if self.flash_intensity <= 0:
                 self.flash_active = False
                 self.flash_intensity = 0
+                self.flash_rings = []
             
-            # Update flash rings
+            # Update flash rings, compacting out faded ones in the same pass
+            live_rings = []
+            keep = live_rings.append
             for ring in self.flash_rings:
                 ring['radius'] += dt * 150
                 ring['alpha'] = int(ring['alpha'] * 0.95)
                 ring['width'] *= 0.98
-        
-        # Update light particles
-        for particle in self.light_particles[:]:
-            particle.update(dt)
-            if particle.life <= 0:
-                self.light_particles.remove(particle)
+                if ring['alpha'] > 10:
+                    keep(ring)
+            self.flash_rings = live_rings
+        
+        # Update light particles - vectorized over the occupied prefix of the
+        # pool, then dead slots are recycled
+        n = self._p_high
+        if n:
+            self.p_xy[:n] += self.p_v[:n] * dt
+            self.p_v[:n, 1] -= 5 * dt  # Rise up
+            self.p_life[:n] -= dt * 0.3
+            self.p_phase[:n] += dt * 3
+            dead = self.p_alive[:n] & (self.p_life[:n] <= 0)
+            if dead.any():
+                # Push in descending order so the lowest slots are reused first,
+                # keeping the occupied prefix short
+                self._free_stack.extend(np.flatnonzero(dead)[::-1].tolist())
+                self.p_alive[:n] &= ~dead
+                live = np.flatnonzero(self.p_alive[:n])
+                self._p_high = int(live[-1]) + 1 if live.size else 0
         
         # Random bioluminescent particle emission
         if random.random() < 0.1:
@@ -211,15 +323,31 @@ class IridescentJellyfish(QWidget):
         """Emit a drifting bioluminescent particle"""
         angle = random.uniform(0, math.pi * 2)
         dist = random.uniform(20, 60)
-        self.light_particles.append(LightParticle(
-            x=self.x + math.cos(angle) * dist,
-            y=self.y + math.sin(angle) * dist + 50,
-            vx=random.uniform(-10, 10),
-            vy=random.uniform(-20, -40),
-            size=random.uniform(2, 5),
-            hue=(self.base_hue + random.uniform(-30, 30)) % 360,
-            life=random.uniform(0.8, 1.5)
-        ))
+        self._spawn_light_particle(
+            self.x + math.cos(angle) * dist,
+            self.y + math.sin(angle) * dist + 50,
+            random.uniform(-10, 10),
+            random.uniform(-20, -40),
+            random.uniform(2, 5),
+            (self.base_hue + random.uniform(-30, 30)) % 360,
+            random.uniform(0.8, 1.5)
+        )
+    
+    def _spawn_light_particle(self, x: float, y: float, vx: float, vy: float,
+                              size: float, hue: float, life: float):
+        """Write a particle into a free pool slot (dropped if the pool is full)"""
+        if not self._free_stack:
+            return
+        i = self._free_stack.pop()
+        self.p_xy[i] = (x, y)
+        self.p_v[i] = (vx, vy)
+        self.p_size[i] = size
+        self.p_hue[i] = hue
+        self.p_life[i] = life
+        self.p_phase[i] = 0.0
+        self.p_alive[i] = True
+        if i >= self._p_high:
+            self._p_high = i + 1
     
     def _update_tentacles(self, dt: float):
         """Update tentacle segment positions with wave motion"""
@@ -255,8 +383,13 @@ class IridescentJellyfish(QWidget):
     
     def paintEvent(self, event):
         """Render iridescent jellyfish"""
+        # Nothing reaches the screen while hidden or faded out completely
+        if not self.isVisible() or self.windowOpacity() <= 0.0:
+            return
+        
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
         painter.fillRect(self.rect(), Qt.GlobalColor.transparent)
         
         cx = 150
@@ -266,7 +399,7 @@ class IridescentJellyfish(QWidget):
         self._draw_light_particles(painter)
         
         # Draw flash rings
-        if self.flash_active:
+        if self.flash_active and self.flash_intensity > 0.01:
             self._draw_flash_rings(painter, cx, cy)
         
         # Draw tentacles (behind bell)
@@ -283,128 +416,150 @@ class IridescentJellyfish(QWidget):
     
     def _draw_light_particles(self, painter: QPainter):
         """Draw drifting bioluminescent particles"""
-        for particle in self.light_particles:
-            px = particle.x - self.x + 150
-            py = particle.y - self.y + 150
-            
-            if not (0 <= px <= 300 and 0 <= py <= 350):
-                continue
-            
+        # Cull dead and off-widget particles for the whole pool in one pass
+        xs = self.p_xy[:, 0] - (self.x - 150)
+        ys = self.p_xy[:, 1] - (self.y - 150)
+        visible = self.p_alive & (xs >= 0) & (xs <= 300) & (ys >= 0) & (ys <= 350)
+        idx = np.flatnonzero(visible)
+        if idx.size == 0:
+            return
+        
+        painter.setPen(_NO_PEN)
+        opacity = painter.opacity()
+        
+        particles = zip(xs[idx].tolist(), ys[idx].tolist(),
+                        self.p_size[idx].tolist(), self.p_hue[idx].tolist(),
+                        self.p_life[idx].tolist(), self.p_phase[idx].tolist())
+        
+        for px, py, p_size, hue, life, phase in particles:
             # Pulsing glow
-            pulse = 0.7 + 0.3 * math.sin(particle.pulse_phase)
-            alpha = int(particle.life * 200 * pulse)
-            
-            # Iridescent color
-            color = QColor.fromHsv(int(particle.hue) % 360, 200, 255, alpha)
+            pulse = 0.7 + 0.3 * math.sin(phase)
+            alpha = life * pulse
+            if alpha <= 0.0:
+                continue
+            hue_key = (int(hue) % 360) // 4
             
-            # Multi-layer glow
-            for i in range(3):
-                size = particle.size * (2 + i * 0.8)
-                layer_alpha = int(alpha * (0.5 - i * 0.15))
-                
-                gradient = QRadialGradient(px, py, size)
-                gradient.setColorAt(0.0, QColor(color.red(), color.green(), color.blue(), layer_alpha))
-                gradient.setColorAt(1.0, QColor(0, 0, 0, 0))
-                
-                painter.setBrush(QBrush(gradient))
-                painter.setPen(Qt.PenStyle.NoPen)
-                painter.drawEllipse(int(px - size), int(py - size), int(size * 2), int(size * 2))
+            # Multi-layer glow folded into one cached brush, centered on the
+            # origin - the brush origin places it on the particle
+            size_key = int(p_size * PARTICLE_GLOW_EXTENT * 2)
+            size = size_key * 0.5
+            painter.setBrushOrigin(QPointF(px, py))
+            painter.setBrush(self._particle_brush(hue_key, size_key))
+            painter.setOpacity(opacity * min(alpha, 1.0))
+            painter.drawEllipse(int(px - size), int(py - size), int(size * 2), int(size * 2))
+        
+        painter.setOpacity(opacity)
+        painter.setBrushOrigin(0, 0)
+    
+    def _particle_brush(self, hue_key: int, size_key: int) -> QBrush:
+        """Radial glow brush for one particle at PARTICLE_PEAK_ALPHA (4° hue, 0.5px radius)"""
+        key = (hue_key, size_key)
+        brush = self._particle_brush_cache.get(key)
+        if brush is None:
+            r, g, b = _HSV_RGB[(hue_key * 4) % 360][_SAT_INDEX[200]]
+            alpha = PARTICLE_PEAK_ALPHA / 255
+            gradient = QRadialGradient(0, 0, size_key * 0.5)
+            for rho in PARTICLE_GLOW_STOPS:
+                # Alpha of the stacked layers composited over each other at rho
+                keep = 1.0
+                for radius, weight in PARTICLE_GLOW_LAYERS:
+                    if rho < radius:
+                        keep *= 1 - alpha * weight * (1 - rho / radius)
+                stop_alpha = min(255, int(round((1 - keep) * 255)))
+                gradient.setColorAt(rho / PARTICLE_GLOW_EXTENT, QColor(r, g, b, stop_alpha))
+            brush = self._particle_brush_cache.put(key, QBrush(gradient))
+        return brush
     
     def _draw_flash_rings(self, painter: QPainter, cx: float, cy: float):
         """Draw expanding flash rings"""
+        # Faded rings are already dropped in update_state
         for ring in self.flash_rings:
-            if ring['alpha'] > 10:
-                # Iridescent ring colors
-                hue = (self.iridescent_shift + ring['radius'] * 2) % 360
-                color = QColor.fromHsv(int(hue), 150, 255, int(ring['alpha']))
-                
-                painter.setPen(QPen(color, ring['width']))
-                painter.setBrush(Qt.BrushStyle.NoBrush)
-                painter.drawEllipse(
-                    int(cx - ring['radius']), 
-                    int(cy - ring['radius'] * 0.8),
-                    int(ring['radius'] * 2),
-                    int(ring['radius'] * 1.6)
-                )
+            # Iridescent ring colors
+            hue = (self.iridescent_shift + ring['radius'] * 2) % 360
+            color = _lut_color(int(hue), 150, int(ring['alpha']))
+            
+            painter.setPen(QPen(color, ring['width']))
+            painter.setBrush(Qt.BrushStyle.NoBrush)
+            painter.drawEllipse(
+                int(cx - ring['radius']), 
+                int(cy - ring['radius'] * 0.8),
+                int(ring['radius'] * 2),
+                int(ring['radius'] * 1.6)
+            )
     
     def _draw_tentacles(self, painter: QPainter):
         """Draw rainbow gradient tentacles with light trails"""
+        # Each tentacle is split into a few bands along its length; a band is one
+        # path with a single hue/width/alpha, stroked once for glow and once for core
+        ox = self.x - 150
+        oy = self.y - 150
+        bands = []
         for i, tentacle in enumerate(self.tentacles):
-            if len(tentacle) < 2:
+            n = len(tentacle)
+            if n < 2:
                 continue
             
             # Each tentacle has different hue
             base_hue = (self.iridescent_shift + i * 40) % 360
             
-            # Draw segments with gradient
-            for j in range(len(tentacle) - 1):
-                seg1 = tentacle[j]
-                seg2 = tentacle[j + 1]
-                
-                # Position relative to widget
-                x1 = seg1.x - self.x + 150
-                y1 = seg1.y - self.y + 150
-                x2 = seg2.x - self.x + 150
-                y2 = seg2.y - self.y + 150
+            # Position relative to widget
+            xs = [seg.x - ox for seg in tentacle]
+            ys = [seg.y - oy for seg in tentacle]
+            
+            edges = [round(b * (n - 1) / TENTACLE_BANDS) for b in range(TENTACLE_BANDS + 1)]
+            for j0, j1 in zip(edges, edges[1:]):
+                if j1 <= j0:
+                    continue
+                seg = tentacle[j0]
                 
-                # Gradient along tentacle length
-                progress = j / len(tentacle)
+                # Gradient along tentacle length (sampled at band middle)
+                progress = (j0 + j1) / (2 * n)
                 hue = (base_hue + progress * 60) % 360
                 
                 # Alpha fades toward tip
-                alpha = int((1 - progress) * 180 * seg1.glow_intensity)
+                alpha = int((1 - progress) * 180 * seg.glow_intensity)
                 
                 # Width tapers
-                width = max(1, seg1.width * (1 - progress * 0.7))
+                width = max(1, seg.width * (1 - progress * 0.7))
                 
-                color = QColor.fromHsv(int(hue), 180, 255, alpha)
-                
-                # Glow effect
-                glow_width = width * 3
-                glow_alpha = int(alpha * 0.3)
-                glow_color = QColor.fromHsv(int(hue), 150, 255, glow_alpha)
-                
-                # Draw glow
-                painter.setPen(QPen(glow_color, glow_width, Qt.PenStyle.SolidLine, Qt.PenCapStyle.RoundCap))
-                painter.drawLine(int(x1), int(y1), int(x2), int(y2))
-                
-                # Draw core
-                painter.setPen(QPen(color, width, Qt.PenStyle.SolidLine, Qt.PenCapStyle.RoundCap))
-                painter.drawLine(int(x1), int(y1), int(x2), int(y2))
+                path = QPainterPath()
+                path.moveTo(xs[j0], ys[j0])
+                for j in range(j0 + 1, j1 + 1):
+                    path.lineTo(xs[j], ys[j])
+                bands.append((hue, width, alpha, path))
+        
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        
+        # Draw glow
+        glow_pen = self._glow_pen
+        for hue, width, alpha, path in bands:
+            glow_pen.setColor(self._hsv_color(hue, 150, int(alpha * 0.3)))
+            glow_pen.setWidthF(width * 3)
+            painter.setPen(glow_pen)
+            painter.drawPath(path)
+        
+        # Draw core
+        core_pen = self._core_pen
+        for hue, width, alpha, path in bands:
+            core_pen.setColor(self._hsv_color(hue, 180, alpha))
+            core_pen.setWidthF(width)
+            painter.setPen(core_pen)
+            painter.drawPath(path)
+    
+    def _hsv_color(self, hue: float, sat: int, alpha: int) -> QColor:
+        """Full-value HSV color, memoized per 4° hue and 4-step alpha"""
+        key = (int(hue) % 360 >> 2, sat, alpha >> 2)
+        color = self._color_cache.get(key)
+        if color is None:
+            color = self._color_cache.put(key, _lut_color(key[0] << 2, sat, key[2] << 2))
+        return color
     
     def _draw_iridescent_bell(self, painter: QPainter, cx: float, cy: float):
         """Draw the main bell with iridescent/opalescent effect"""
         
         # Bell dimensions with pulsing
-        bell_w = 70 * self.bell_pulse
-        bell_h = 55 * self.bell_pulse
-        
-        # Create iridescent gradient - shifting rainbow
-        # Main body gradient (conical for iridescent effect)
-        bell_gradient = QConicalGradient(cx, cy, self.iridescent_shift)
-        
-        # Rainbow iridescent colors
-        colors = [
-            (0.0, QColor(150, 100, 255, 180)),    # Purple
-            (0.15, QColor(100, 150, 255, 180)),   # Blue
-            (0.3, QColor(100, 255, 200, 180)),    # Cyan
-            (0.45, QColor(150, 255, 150, 180)),   # Green
-            (0.6, QColor(255, 255, 100, 180)),    # Yellow
-            (0.75, QColor(255, 150, 100, 180)),   # Orange
-            (0.9, QColor(255, 100, 150, 180)),    # Pink
-            (1.0, QColor(150, 100, 255, 180)),    # Purple
-        ]
-        
-        for pos, color in colors:
-            # Add flash intensity
-            flash_boost = int(self.flash_intensity * 50)
-            boosted = QColor(
-                min(255, color.red() + flash_boost),
-                min(255, color.green() + flash_boost),
-                min(255, color.blue() + flash_boost),
-                color.alpha()
-            )
-            bell_gradient.setColorAt(pos, boosted)
+        bell_w = BELL_W * self.bell_pulse
+        bell_h = BELL_H * self.bell_pulse
         
         # Bell shape (semi-circle with ruffled edge)
         bell_path = QPainterPath()
@@ -417,47 +572,34 @@ class IridescentJellyfish(QWidget):
             cx + bell_w, cy + 20
         )
         
-        # Ruffled bottom edge (marginal lappets)
-        num_lappets = 16
-        for i in range(num_lappets + 1):
-            t = i / num_lappets
-            angle = math.pi * t
-            base_x = cx + math.cos(math.pi - angle) * bell_w
-            base_y = cy + 20
-            
-            # Ruffle effect
-            ruffle = math.sin(i * 2 + self.time * 3) * 5
-            lappet_x = base_x + ruffle * 0.3
-            lappet_y = base_y + abs(ruffle)
-            
-            if i == 0:
-                bell_path.lineTo(lappet_x, lappet_y)
-            else:
-                # Control points for smooth ruffle
-                prev_t = (i - 1) / num_lappets
-                prev_angle = math.pi * prev_t
-                cpx = cx + math.cos(math.pi - (prev_angle + angle) / 2) * (bell_w + 8)
-                cpy = cy + 20 + 5
-                bell_path.quadTo(cpx, cpy, lappet_x, lappet_y)
+        # Ruffled bottom edge (marginal lappets), evaluated for all lappets at once
+        ruffle = np.sin(_LAPPET_IDX * 2 + self.time * 3) * 5
+        lappet_xs = (cx + _LAPPET_COS * bell_w + ruffle * 0.3).tolist()
+        lappet_ys = (cy + 20 + np.abs(ruffle)).tolist()
         
-        bell_path.closeSubpath()
+        bell_path.lineTo(lappet_xs[0], lappet_ys[0])
+        # Control points for smooth ruffle
+        cpxs = (cx + _LAPPET_CP_COS * (bell_w + 8)).tolist()
+        cpy = cy + 20 + 5
+        for cpx, lappet_x, lappet_y in zip(cpxs, lappet_xs[1:], lappet_ys[1:]):
+            bell_path.quadTo(cpx, cpy, lappet_x, lappet_y)
         
-        # Draw bell glow (outer)
-        glow_gradient = QRadialGradient(cx, cy, bell_w * 1.5)
-        glow_hue = int(self.iridescent_shift) % 360
-        glow_color = QColor.fromHsv(glow_hue, 150, 255, 60)
-        glow_gradient.setColorAt(0.0, QColor(glow_color.red(), glow_color.green(), glow_color.blue(), 80 + int(self.flash_intensity * 100)))
-        glow_gradient.setColorAt(1.0, QColor(0, 0, 0, 0))
+        bell_path.closeSubpath()
         
-        painter.setBrush(QBrush(glow_gradient))
-        painter.setPen(Qt.PenStyle.NoPen)
-        painter.drawEllipse(int(cx - bell_w * 1.5), int(cy - bell_h), int(bell_w * 3), int(bell_h * 3))
+        # Draw bell glow (outer) - cached sprite stretched to the current pulse
+        glow_sprite = self._bell_glow_sprite()
+        painter.drawPixmap(
+            QRectF(cx - bell_w * 1.5, cy - bell_h, bell_w * 3, bell_h * 3),
+            glow_sprite,
+            QRectF(glow_sprite.rect())
+        )
+        painter.setPen(_NO_PEN)
         
         # Draw bell body
-        painter.setBrush(QBrush(bell_gradient))
+        painter.setBrush(self._bell_brush(cx, cy))
         
         # Semi-transparent outline
-        outline_color = QColor.fromHsv(int(self.iridescent_shift) % 360, 200, 255, 120)
+        outline_color = _lut_color(int(self.iridescent_shift) % 360, 200, 120)
         pen_width = 1.5 + self.flash_intensity * 2
         painter.setPen(QPen(outline_color, pen_width))
         painter.drawPath(bell_path)
@@ -465,12 +607,59 @@ class IridescentJellyfish(QWidget):
         # Inner highlight (gelatinous look)
         highlight_gradient = QRadialGradient(cx - 15, cy - 10, bell_w * 0.6)
         highlight_gradient.setColorAt(0.0, QColor(255, 255, 255, 100 + int(self.flash_intensity * 100)))
-        highlight_gradient.setColorAt(1.0, QColor(255, 255, 255, 0))
+        highlight_gradient.setColorAt(1.0, _CLEAR_WHITE)
         
         painter.setBrush(QBrush(highlight_gradient))
-        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setPen(_NO_PEN)
         painter.drawEllipse(int(cx - bell_w * 0.5), int(cy - bell_h * 0.5), int(bell_w), int(bell_h * 0.8))
     
+    def _bell_glow_sprite(self) -> QPixmap:
+        """Outer bell glow baked at half resolution, cached per 3° of shift and 0.1 of flash"""
+        hue_key = int(self.iridescent_shift) // 3
+        flash_key = int(self.flash_intensity * 10)
+        key = (hue_key, flash_key)
+        sprite = self._bell_glow_cache.get(key)
+        if sprite is None:
+            glow_w = BELL_W * 3
+            glow_h = BELL_H * 3
+            sprite = QPixmap(glow_w // 2, glow_h // 2)
+            sprite.fill(Qt.GlobalColor.transparent)
+            
+            # Same geometry as the live glow, with the bell centre at (BELL_W * 1.5, BELL_H)
+            glow_gradient = QRadialGradient(BELL_W * 1.5, BELL_H, BELL_W * 1.5)
+            glow_gradient.setColorAt(0.0, _lut_color(hue_key * 3, 150, 80 + flash_key * 10))
+            glow_gradient.setColorAt(1.0, _TRANSPARENT)
+            
+            sprite_painter = QPainter(sprite)
+            sprite_painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            sprite_painter.scale(0.5, 0.5)
+            sprite_painter.setBrush(QBrush(glow_gradient))
+            sprite_painter.setPen(_NO_PEN)
+            sprite_painter.drawEllipse(0, 0, glow_w, glow_h)
+            sprite_painter.end()
+            sprite = self._bell_glow_cache.put(key, sprite)
+        return sprite
+    
+    def _bell_brush(self, cx: float, cy: float) -> QBrush:
+        """Shifting rainbow body brush, cached per 2° of shift and 0.1 of flash"""
+        shift_key = int(self.iridescent_shift) // 2
+        flash_key = int(self.flash_intensity * 10)
+        key = (shift_key, flash_key)
+        brush = self._bell_brush_cache.get(key)
+        if brush is None:
+            # Main body gradient (conical for iridescent effect)
+            bell_gradient = QConicalGradient(cx, cy, shift_key * 2)
+            flash_boost = flash_key * 5
+            for pos, (r, g, b) in BELL_RAINBOW:
+                bell_gradient.setColorAt(pos, QColor(
+                    min(255, r + flash_boost),
+                    min(255, g + flash_boost),
+                    min(255, b + flash_boost),
+                    180
+                ))
+            brush = self._bell_brush_cache.put(key, QBrush(bell_gradient))
+        return brush
+    
     def _draw_internal_glow(self, painter: QPainter, cx: float, cy: float):
         """Draw internal bioluminescent structures"""
         
@@ -479,27 +668,30 @@ class IridescentJellyfish(QWidget):
         glow_hue = (self.iridescent_shift + 180) % 360
         
         cavity_gradient = QRadialGradient(cx, cy + 10, glow_size)
-        cavity_gradient.setColorAt(0.0, QColor.fromHsv(int(glow_hue), 100, 255, 150 + int(self.flash_intensity * 100)))
-        cavity_gradient.setColorAt(0.5, QColor.fromHsv(int(glow_hue), 150, 255, 80))
-        cavity_gradient.setColorAt(1.0, QColor(0, 0, 0, 0))
+        cavity_gradient.setColorAt(0.0, _lut_color(int(glow_hue), 100, 150 + int(self.flash_intensity * 100)))
+        cavity_gradient.setColorAt(0.5, _lut_color(int(glow_hue), 150, 80))
+        cavity_gradient.setColorAt(1.0, _TRANSPARENT)
         
         painter.setBrush(QBrush(cavity_gradient))
-        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setPen(_NO_PEN)
         painter.drawEllipse(int(cx - glow_size), int(cy + 10 - glow_size), int(glow_size * 2), int(glow_size * 2))
         
         # Radial canals (lines from center)
-        num_canals = 8
-        for i in range(num_canals):
-            angle = (i / num_canals) * math.pi * 2 + self.time * 0.5
-            length = 25 + math.sin(self.time + i) * 3
-            
-            x1 = cx + math.cos(angle) * 8
-            y1 = cy + 10 + math.sin(angle) * 6
-            x2 = cx + math.cos(angle) * length
-            y2 = cy + 10 + math.sin(angle) * length * 0.6
-            
+        rot = self.time * 0.5
+        cos_r = math.cos(rot)
+        sin_r = math.sin(rot)
+        cos_a = _CANAL_COS * cos_r - _CANAL_SIN * sin_r
+        sin_a = _CANAL_SIN * cos_r + _CANAL_COS * sin_r
+        lengths = 25 + np.sin(self.time + _CANAL_IDX) * 3
+        
+        x1s = (cx + cos_a * 8).tolist()
+        y1s = (cy + 10 + sin_a * 6).tolist()
+        x2s = (cx + cos_a * lengths).tolist()
+        y2s = (cy + 10 + sin_a * lengths * 0.6).tolist()
+        
+        for i, (x1, y1, x2, y2) in enumerate(zip(x1s, y1s, x2s, y2s)):
             canal_hue = (self.iridescent_shift + i * 45) % 360
-            canal_color = QColor.fromHsv(int(canal_hue), 180, 255, 100)
+            canal_color = _lut_color(int(canal_hue), 180, 100)
             
             painter.setPen(QPen(canal_color, 2.0, Qt.PenStyle.SolidLine, Qt.PenCapStyle.RoundCap))
             painter.drawLine(int(x1), int(y1), int(x2), int(y2))
@@ -515,36 +707,41 @@ class IridescentJellyfish(QWidget):
         crown_hue = int(self.iridescent_shift) % 360
         
         # Crown lights (rhopalia - sensory organs)
-        num_lights = 6
-        for i in range(num_lights):
-            angle = (i / num_lights) * math.pi * 2 + self.time * 0.3
-            light_x = cx + math.cos(angle) * 18
-            light_y = cy - 5 + math.sin(angle) * 10
-            
+        rot = self.time * 0.3
+        cos_r = math.cos(rot)
+        sin_r = math.sin(rot)
+        light_xs = (cx + (_CROWN_COS * cos_r - _CROWN_SIN * sin_r) * 18).tolist()
+        light_ys = (cy - 5 + (_CROWN_SIN * cos_r + _CROWN_COS * sin_r) * 10).tolist()
+        pulses = (0.6 + 0.4 * np.sin(self.time * 4 + _CROWN_IDX)).tolist()
+        
+        core_rect = QRectF(self._core_blob.rect())
+        for i, (light_x, light_y, pulse) in enumerate(zip(light_xs, light_ys, pulses)):
             # Each light has different color
             light_hue = (crown_hue + i * 60) % 360
-            light_color = QColor.fromHsv(int(light_hue), 200, 255)
+            light_color = _lut_color(light_hue, 200)
             
             # Pulsing glow
-            pulse = 0.6 + 0.4 * math.sin(self.time * 4 + i)
             size = 4 + pulse * 2 + self.flash_intensity * 3
             alpha = int(150 * pulse + self.flash_intensity * 100)
             
             # Outer glow
             glow = QRadialGradient(light_x, light_y, size * 2)
             glow.setColorAt(0.0, QColor(light_color.red(), light_color.green(), light_color.blue(), alpha))
-            glow.setColorAt(1.0, QColor(0, 0, 0, 0))
+            glow.setColorAt(1.0, _TRANSPARENT)
             
             painter.setBrush(QBrush(glow))
-            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setPen(_NO_PEN)
             painter.drawEllipse(int(light_x - size * 2), int(light_y - size * 2), int(size * 4), int(size * 4))
             
-            # Core
-            painter.setBrush(QBrush(QColor(255, 255, 255, 200)))
-            painter.drawEllipse(int(light_x - size * 0.5), int(light_y - size * 0.5), int(size), int(size))
+            # Core - prebaked white blob scaled to the light size
+            painter.drawPixmap(
+                QRectF(light_x - size * 0.5, light_y - size * 0.5, size, size),
+                self._core_blob,
+                core_rect
+            )
         
         # Crown groove outline (iridescent line)
-        groove_color = QColor.fromHsv(int(crown_hue), 150, 255, 150)
+        groove_color = _lut_color(int(crown_hue), 150, 150)
         painter.setPen(QPen(groove_color, 2.5))
         painter.setBrush(Qt.BrushStyle.NoBrush)
         painter.drawEllipse(int(cx - groove_w), int(cy - groove_h - 5), int(groove_w * 2), int(groove_h * 2))
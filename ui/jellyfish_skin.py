@@ -12,13 +12,109 @@ Features:
 """
 
 import math
-import random
+import time
 import numpy as np
 from PySide6.QtGui import (
     QPainter, QColor, QPainterPath, QRadialGradient,
-    QLinearGradient, QBrush, QPen
+    QLinearGradient, QBrush, QPen, QPolygonF, QPixmap, QTransform
 )
-from PySide6.QtCore import QPointF, Qt
+from PySide6.QtCore import QPointF, QRectF, Qt
+
+from ui.render_cache import LRUCache
+from utils.jit import njit
+
+# Frame time the per-frame animation rates were tuned for; larger gaps
+# (stalls, hidden windows) are clamped to MAX_DT
+BASE_DT = 0.033
+MAX_DT = 0.1
+
+# Shared default for missing position/velocity entries
+_ZERO2 = (0.0, 0.0)
+
+# Bell shape is cached per quantized contraction level
+BELL_CONTRACTION_BUCKETS = 64
+
+# Bell, crown groove and rhopalia are baked into sprites keyed by these
+# contraction/glow buckets and the on-screen scale (quarter steps)
+BELL_SPRITE_BUCKETS = 32
+BELL_SPRITE_GLOW_BUCKETS = 16
+BELL_SPRITE_EXTENT = 1.25  # Half-size of the sprite in bell radii
+
+# Organs and tentacles evenly spaced around the bell margin
+NUM_RHOPALIA = 8
+NUM_TENTACLES = 10
+
+# Independent sway phases, each drifting at its own rate; tentacles share
+# them round-robin
+NUM_SWAY_PHASES = 12
+_SWAY_RATES = 0.03 + np.arange(NUM_SWAY_PHASES) * 0.01
+_TENTACLE_SWAY_INDEX = np.arange(NUM_TENTACLES) % NUM_SWAY_PHASES
+
+# Full tentacle resolution (segments per tentacle)
+TENTACLE_SEGMENTS = 15
+TRAILING_SEGMENTS = 30
+
+# Expanding flash rings, stroked in inner/outer bands
+NUM_FLASH_RINGS = 4
+FLASH_RING_BANDS = 2
+
+# Oral arms and their frilled edge profile (fixed, so the sines are tabled)
+NUM_ORAL_ARMS = 4
+_FRILL_T = [j / 4 for j in range(5)]
+_FRILL_BULGE = [3 * math.sin(t * math.pi) for t in _FRILL_T]
+
+# Marginal tentacles are stroked in this many pen bands from base to tip
+TENTACLE_BANDS = 3
+TRAILING_BANDS = 4
+
+# The trailing tentacle tip glows past this fraction of its length
+TRAILING_GLOW_START = 0.8
+
+# Level of detail by on-screen scale: below LOD_DETAIL_SCALE the small
+# features (rhopalia, crown groove, oral-arm frills) are skipped, below
+# LOD_LOW_SCALE tentacles use fewer segments, and below LOD_CULL_SCALE the
+# ambient glow layers are dropped unless a flash is playing
+LOD_DETAIL_SCALE = 0.6
+LOD_LOW_SCALE = 0.5
+LOD_CULL_SCALE = 0.3
+LOD_AA_TENTACLE_SCALE = 1.0
+LOW_TENTACLE_SEGMENTS = 6
+LOW_TRAILING_SEGMENTS = 10
+
+# Between flashes (the common case) tentacles use a lighter resolution too
+AMBIENT_TENTACLE_SEGMENTS = 8
+AMBIENT_TRAILING_SEGMENTS = 15
+
+# Normalized positions along a tentacle for every resolution in use
+_SEGMENT_T = {
+    n: np.linspace(0.0, 1.0, n + 1)
+    for n in (TENTACLE_SEGMENTS, TRAILING_SEGMENTS, LOW_TENTACLE_SEGMENTS,
+              LOW_TRAILING_SEGMENTS, AMBIENT_TENTACLE_SEGMENTS, AMBIENT_TRAILING_SEGMENTS)
+}
+
+
+@njit(cache=True, fastmath=True)
+def _compute_tentacles(ts, phases, start_x, start_y, lengths, pts):
+    """Fill pts, an (n, len(ts), 2) array, with marginal tentacle points: rows are tentacles."""
+    n = phases.shape[0]
+    m = ts.shape[0]
+    t = ts.reshape(1, m)
+    ph = phases.reshape(n, 1)
+    pts[:, :, 0] = (start_x.reshape(n, 1)
+                    + np.sin(ph) * 10 * t * t        # More sway at tip
+                    + np.sin(ph + t * 4) * 3 * t)    # Undulation
+    pts[:, :, 1] = start_y.reshape(n, 1) + lengths.reshape(n, 1) * t
+
+
+@njit(cache=True, fastmath=True)
+def _compute_trailing(ts, phase, time_, start_x, start_y, length, pts):
+    """Fill pts, a (len(ts), 2) array, with trailing tentacle points."""
+    # Flowing motion (sine waves)
+    pts[:, 0] = (start_x
+                 + np.sin(phase + ts * 3) * 15 * ts
+                 + np.sin(phase * 0.7 + ts * 5) * 8 * ts
+                 + np.sin(time_ * 0.3 + ts * 2) * 5 * ts)
+    pts[:, 1] = start_y + length * ts
 
 
 class BioluminescentJellyfishSkin:
@@ -47,7 +143,7 @@ class BioluminescentJellyfishSkin:
         
         # Animation state
         self.bell_contraction = 0.0  # 0 = relaxed, 1 = fully contracted
-        self.tentacle_sway = [random.uniform(0, math.pi * 2) for _ in range(12)]
+        self.tentacle_sway = np.random.uniform(0, math.pi * 2, NUM_SWAY_PHASES)
         self.trailing_tentacle_phase = 0.0
         
         # Size
@@ -57,11 +153,84 @@ class BioluminescentJellyfishSkin:
         
         self.size_scale = 1.0
         self.opacity = 0.9
+        self.lod = 1.0  # On-screen scale of the last render
+        self._tentacle_segments = TENTACLE_SEGMENTS
+        self._trailing_segments = TRAILING_SEGMENTS
+        
+        # Wall time of the last render, for frames without a dt
+        self._last_render_time = None
         self._facing_left = False
         
+        # Static bell geometry, rebuilt only when bell_radius changes
+        self._bell_path_cache = {}
+        self._groove_path = None
+        self._shape_cache_radius = self.bell_radius
+        self._bell_sprites = LRUCache(maxsize=192)
+        self._build_margin_layout()
+        
+        # Point buffers for the tentacle kernels, one per level of detail
+        self._tent_bufs = {
+            n: np.empty((NUM_TENTACLES, n + 1, 2))
+            for n in (TENTACLE_SEGMENTS, LOW_TENTACLE_SEGMENTS, AMBIENT_TENTACLE_SEGMENTS)
+        }
+        self._trail_bufs = {
+            n: np.empty((n + 1, 2))
+            for n in (TRAILING_SEGMENTS, LOW_TRAILING_SEGMENTS, AMBIENT_TRAILING_SEGMENTS)
+        }
+        
+        # Long-lived colors: alpha is updated in place instead of allocating
+        # a QColor (and QPen) for every stroke
+        self._qc_groove = QColor(30, 8, 15, 180)
+        self._qc_rim = QColor(0, 200, 255, 0)
+        self._qc_ambient_ring = QColor(0, 180, 255, 0)
+        self._qc_ring = QColor(20, 220, 255, 0)
+        self._qc_rhopalia = QColor(0, 220, 255, 0)
+        self._qc_tent = QColor(140, 60, 80, 0)
+        self._qc_trail = QColor(160, 70, 90, 0)
+        self._qc_trail_glow = QColor(50, 230, 255, 0)
+        self._qc_node = QColor(0, 220, 255, 0)
+        self._bell_pen = QPen(QColor(60, 15, 25, 150), 1)
+        self._stroke_pen = QPen()
+        
+        # Gradient templates at full glow on a unit radius; per frame only the
+        # brush transform and painter opacity change
+        glow_grad = QRadialGradient(0, 0, 1)
+        glow_grad.setColorAt(0.0, QColor(0, 200, 255, 60))
+        glow_grad.setColorAt(0.4, QColor(0, 150, 255, 30))
+        glow_grad.setColorAt(0.7, QColor(50, 100, 255, 12))
+        glow_grad.setColorAt(1.0, QColor(0, 0, 0, 0))
+        self._glow_brush = QBrush(glow_grad)
+        
+        center_grad = QRadialGradient(0, 0, 1)
+        center_grad.setColorAt(0.0, QColor(100, 240, 255, 100))
+        center_grad.setColorAt(0.5, QColor(0, 200, 255, 60))
+        center_grad.setColorAt(1.0, QColor(0, 0, 0, 0))
+        self._center_glow_brush = QBrush(center_grad)
+        
+        # One gradient per oral arm; only its end points move
+        self._arm_grads = []
+        for _ in range(NUM_ORAL_ARMS):
+            arm_grad = QLinearGradient()
+            arm_grad.setColorAt(0.0, QColor(100, 40, 60, 150))
+            arm_grad.setColorAt(0.5, QColor(80, 30, 50, 120))
+            arm_grad.setColorAt(1.0, QColor(60, 20, 40, 80))
+            self._arm_grads.append(arm_grad)
+        
         if config:
             self.apply_config(config)
 
+    def _pen(self, color, alpha, width):
+        """Shared stroke pen set to color at alpha (QPainter.setPen copies it).
+        
+        Width is snapped to 0.5 px and alpha to multiples of 8 so consecutive
+        strokes mostly repeat the same pen state.
+        """
+        color.setAlpha(alpha & ~7)
+        pen = self._stroke_pen
+        pen.setColor(color)
+        pen.setWidthF(max(0.5, round(width * 2) / 2))
+        return pen
+
     def apply_config(self, config):
         fish_cfg = config.get("fish") if hasattr(config, "get") else {}
         if isinstance(fish_cfg, dict):
@@ -75,10 +244,9 @@ class BioluminescentJellyfishSkin:
 
     def render(self, painter, local_pos, fish_state):
         """Main render entry point."""
-        x = fish_state.get("position", [0, 0])[0]
-        y = fish_state.get("position", [0, 0])[1]
-        angle = fish_state.get("facing_angle", 0)
-        self.update_and_render(painter, x, y, angle, fish_state)
+        pos = fish_state.get("position", _ZERO2)
+        self.update_and_render(painter, pos[0], pos[1],
+                               fish_state.get("facing_angle", 0), fish_state)
 
     def update_and_render(self, painter, x, y, angle, fish_state):
         """Render the bioluminescent jellyfish.
@@ -87,21 +255,86 @@ class BioluminescentJellyfishSkin:
         Tentacles always hang DOWN due to gravity.
         Only the bell pulses for propulsion.
         """
-        vx = fish_state.get("velocity", [0, 0])[0]
-        vy = fish_state.get("velocity", [0, 0])[1]
-        speed = math.hypot(vx, vy)
-        mood = fish_state.get("mood", 80)
+        vel = fish_state.get("velocity", _ZERO2)
+        speed = math.hypot(vel[0], vel[1])
         
-        dt = 0.033
         speed_factor = min(speed / 100.0, 2.0)
+        self._advance(self._frame_dt(fish_state), speed_factor)
+        
+        # Jellyfish orientation: ALWAYS UPRIGHT
+        # Unlike fish, jellyfish don't roll over - bell stays up, tentacles stay down
+        # We only use the position (x,y), not the rotation angle
         
-        # Update animation
+        sc = self.size_scale
+        
+        # Effective on-screen scale includes any transform the caller applied
+        transform = painter.worldTransform()
+        lod = sc * math.hypot(transform.m11(), transform.m12())
+        self.lod = lod
+        detailed = lod >= LOD_DETAIL_SCALE
+        ambient = lod >= LOD_CULL_SCALE or self.flash_triggered
+        
+        # Tentacle resolution: full only while a flash plays
+        if lod < LOD_LOW_SCALE:
+            self._tentacle_segments = LOW_TENTACLE_SEGMENTS
+            self._trailing_segments = LOW_TRAILING_SEGMENTS
+        elif not self.flash_triggered:
+            self._tentacle_segments = AMBIENT_TENTACLE_SEGMENTS
+            self._trailing_segments = AMBIENT_TRAILING_SEGMENTS
+        else:
+            self._tentacle_segments = TENTACLE_SEGMENTS
+            self._trailing_segments = TRAILING_SEGMENTS
+        
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing, True)
+        painter.translate(x, y)
+        
+        # Jellyfish stays upright - NO rotation based on movement angle
+        # Only scale for size, no flipping or rotation
+        painter.scale(sc, sc)
+        
+        # Cached margin layout and bell geometry follow bell_radius
+        self._sync_shape_cache()
+        
+        # Render back to front
+        if ambient:
+            self._draw_bioluminescent_glow(painter)
+        # Thin tapered strokes gain little from antialiasing at normal sizes;
+        # it is kept when the jellyfish is scaled up enough to show jaggies
+        if lod <= LOD_AA_TENTACLE_SCALE:
+            painter.setRenderHint(QPainter.Antialiasing, False)
+        self._draw_trailing_tentacle(painter, speed_factor)
+        self._draw_tentacles(painter, speed_factor)
+        painter.setRenderHint(QPainter.Antialiasing, True)
+        self._draw_oral_arms(painter, speed_factor, frilled=detailed)
+        # Bell, crown groove and sensory organs (rhopalia) in one blit, baked
+        # in device pixels: the world transform misses the HiDPI pixel ratio
+        self._draw_bell_sprite(painter, lod * painter.device().devicePixelRatioF(), detailed)
+        if ambient:
+            self._draw_bioluminescent_rings(painter)
+        
+        painter.restore()
+
+    def _frame_dt(self, fish_state):
+        """Seconds to advance: the caller's dt, else wall time since the last render."""
+        now = time.perf_counter()
+        last = self._last_render_time
+        self._last_render_time = now
+        dt = fish_state.get("dt")
+        if dt is None:
+            dt = BASE_DT if last is None else now - last
+        return min(max(dt, 0.0), MAX_DT)
+
+    def _advance(self, dt, speed_factor):
+        """Advance pulse, flash and sway animation by dt seconds."""
+        # Per-frame rates below were tuned at BASE_DT
+        step = dt / BASE_DT
         self.time += dt
         
         # Bell pulsing for swimming (0.5-1 Hz)
         # Real jellyfish pulse their bell to push water out for propulsion
         pulse_speed = 0.08 + speed_factor * 0.04
-        self.pulse_phase += pulse_speed
+        self.pulse_phase += pulse_speed * step
         self.bell_contraction = (math.sin(self.pulse_phase) + 1) / 2  # 0 to 1
         
         # Flash animation
@@ -116,37 +349,10 @@ class BioluminescentJellyfishSkin:
             self.glow_intensity = 0.15 + 0.1 * math.sin(self.time * 2)
         
         # Trailing tentacle animation
-        self.trailing_tentacle_phase += 0.05 + speed_factor * 0.02
+        self.trailing_tentacle_phase += (0.05 + speed_factor * 0.02) * step
         
         # Update tentacle sway (gentle drifting motion)
-        for i in range(len(self.tentacle_sway)):
-            self.tentacle_sway[i] += 0.03 + i * 0.01
-        
-        # Jellyfish orientation: ALWAYS UPRIGHT
-        # Unlike fish, jellyfish don't roll over - bell stays up, tentacles stay down
-        # We only use the position (x,y), not the rotation angle
-        
-        sc = self.size_scale
-        
-        painter.save()
-        painter.setRenderHint(QPainter.Antialiasing, True)
-        painter.translate(x, y)
-        
-        # Jellyfish stays upright - NO rotation based on movement angle
-        # Only scale for size, no flipping or rotation
-        painter.scale(sc, sc)
-        
-        # Render back to front
-        self._draw_bioluminescent_glow(painter)
-        self._draw_trailing_tentacle(painter, speed_factor)
-        self._draw_tentacles(painter, speed_factor)
-        self._draw_oral_arms(painter, speed_factor)
-        self._draw_bell(painter, speed_factor)
-        self._draw_crown_groove(painter)
-        self._draw_bioluminescent_rings(painter)
-        self._draw_rhopalia(painter)  # Sensory organs
-        
-        painter.restore()
+        self.tentacle_sway += _SWAY_RATES * step
 
     def _draw_bioluminescent_glow(self, painter):
         """Outer glow effect for bioluminescence."""
@@ -155,26 +361,110 @@ class BioluminescentJellyfishSkin:
         
         # Expanding glow aura
         glow_radius = self.bell_radius * (2.0 + self.glow_intensity * 2)
-        alpha = int(60 * self.glow_intensity)
-        
-        gradient = QRadialGradient(0, 0, glow_radius)
-        gradient.setColorAt(0.0, QColor(0, 200, 255, alpha))
-        gradient.setColorAt(0.4, QColor(0, 150, 255, int(alpha * 0.5)))
-        gradient.setColorAt(0.7, QColor(50, 100, 255, int(alpha * 0.2)))
-        gradient.setColorAt(1.0, QColor(0, 0, 0, 0))
-        
+        self._glow_brush.setTransform(QTransform.fromScale(glow_radius, glow_radius))
+        self._fill_faded(painter, self._glow_brush, self.glow_intensity,
+                         0, 0, glow_radius, glow_radius * 0.8)
+
+    def _fill_faded(self, painter, brush, fade, cx, cy, rx, ry):
+        """Fill an ellipse with a gradient template whose stops are scaled by fade."""
+        opacity = painter.opacity()
+        painter.setOpacity(opacity * fade)
         painter.setPen(Qt.NoPen)
-        painter.setBrush(QBrush(gradient))
-        painter.drawEllipse(QPointF(0, 0), glow_radius, glow_radius * 0.8)
+        painter.setBrush(brush)
+        painter.drawEllipse(QPointF(cx, cy), rx, ry)
+        painter.setOpacity(opacity)
+
+    def _draw_bell_sprite(self, painter, pixel_scale, detailed):
+        """Blit the prebaked bell for the current contraction and glow level.
 
-    def _draw_bell(self, painter, speed_factor):
+        pixel_scale is device pixels per bell unit.
+        """
+        c_key = round(self.bell_contraction * (BELL_SPRITE_BUCKETS - 1))
+        # Glow only tints the crown groove and rhopalia, which plain sprites skip
+        g_key = round(min(1.0, self.glow_intensity) * (BELL_SPRITE_GLOW_BUCKETS - 1)) if detailed else 0
+        s_key = max(1, math.ceil(pixel_scale * 4))
+        key = (c_key, g_key, s_key, detailed)
+        sprite = self._bell_sprites.get(key)
+        if sprite is None:
+            sprite = self._bell_sprites.put(
+                key, self._bake_bell_sprite(c_key / (BELL_SPRITE_BUCKETS - 1),
+                                            g_key / (BELL_SPRITE_GLOW_BUCKETS - 1),
+                                            s_key / 4, detailed))
+        
+        half = self.bell_radius * BELL_SPRITE_EXTENT
+        painter.drawPixmap(QRectF(-half, -half, half * 2, half * 2), sprite,
+                           QRectF(sprite.rect()))
+
+    def _bake_bell_sprite(self, contraction, glow, scale, detailed):
+        """Render bell, crown groove and rhopalia into a transparent pixmap at scale."""
+        half = self.bell_radius * BELL_SPRITE_EXTENT
+        size = math.ceil(half * 2 * scale)
+        sprite = QPixmap(size, size)
+        sprite.fill(Qt.GlobalColor.transparent)
+        
+        sprite_painter = QPainter(sprite)
+        sprite_painter.setRenderHint(QPainter.Antialiasing, True)
+        sprite_painter.scale(size / (half * 2), size / (half * 2))
+        sprite_painter.translate(half, half)
+        self._draw_bell(sprite_painter, contraction)
+        if detailed:
+            self._draw_crown_groove(sprite_painter, glow)
+            self._draw_rhopalia(sprite_painter, glow)
+        sprite_painter.end()
+        return sprite
+
+    def _draw_bell(self, painter, contraction):
         """
         Draw the bell (umbrella) with pulsing contraction.
         Atolla has a crown-like shape with deep groove.
         """
-        # Bell shape changes with contraction
-        contraction = self.bell_contraction
+        # Bell shape only depends on contraction, so it is cached per bucket
+        key = round(contraction * (BELL_CONTRACTION_BUCKETS - 1))
+        cached = self._bell_path_cache.get(key)
+        if cached is None:
+            cached = self._build_bell(key / (BELL_CONTRACTION_BUCKETS - 1))
+            self._bell_path_cache[key] = cached
+        bell_path, bell_brush, inner_path, inner_brush = cached
+        
+        painter.setPen(self._bell_pen)
+        painter.setBrush(bell_brush)
+        painter.drawPath(bell_path)
         
+        # Inner bell surface (translucent)
+        painter.setBrush(inner_brush)
+        painter.setPen(Qt.NoPen)
+        painter.drawPath(inner_path)
+
+    def _sync_shape_cache(self):
+        """Reset cached bell geometry and margin layout if bell_radius has changed."""
+        if self._shape_cache_radius != self.bell_radius:
+            self._bell_path_cache.clear()
+            self._groove_path = None
+            self._bell_sprites.clear()
+            self._shape_cache_radius = self.bell_radius
+            self._build_margin_layout()
+
+    def _build_margin_layout(self):
+        """Precompute fixed positions of rhopalia and tentacle roots on the bell margin."""
+        margin_radius = self.bell_radius * 0.9
+        
+        angles = np.arange(NUM_RHOPALIA) / NUM_RHOPALIA * 2 * math.pi
+        self._rhopalia_xy = [(x, y) for x, y in zip(
+            (np.cos(angles) * margin_radius).tolist(),
+            (np.sin(angles) * margin_radius * 0.3).tolist()  # Flattened
+        )]
+        self._rhopalia_path = QPainterPath()
+        for rx, ry in self._rhopalia_xy:
+            self._rhopalia_path.addEllipse(QPointF(rx, ry), 2.5, 2)
+        
+        idx = np.arange(NUM_TENTACLES)
+        angles = idx / NUM_TENTACLES * 2 * math.pi
+        self._tentacle_start_x = np.cos(angles) * margin_radius
+        self._tentacle_start_y = np.sin(angles) * margin_radius * 0.3
+        self._tentacle_length_scale = 0.8 + 0.4 * np.sin(idx * 0.7)
+
+    def _build_bell(self, contraction):
+        """Build bell and inner-bell paths plus brushes for one contraction level."""
         # Base bell dimensions
         base_radius = self.bell_radius
         # Bell flattens when contracted (jet propulsion)
@@ -242,10 +532,6 @@ class BioluminescentJellyfishSkin:
         bell_grad.setColorAt(0.85, QColor(100, 25, 40, 150))
         bell_grad.setColorAt(1.0, QColor(120, 40, 60, 100))
         
-        painter.setPen(QPen(QColor(60, 15, 25, 150), 1))
-        painter.setBrush(QBrush(bell_grad))
-        painter.drawPath(bell_path)
-        
         # Inner bell surface (translucent)
         inner_path = QPainterPath()
         inner_radius = base_radius * 0.7
@@ -256,30 +542,32 @@ class BioluminescentJellyfishSkin:
         inner_grad.setColorAt(0.0, QColor(40, 10, 20, 120))
         inner_grad.setColorAt(1.0, QColor(60, 20, 30, 80))
         
-        painter.setBrush(QBrush(inner_grad))
-        painter.setPen(Qt.NoPen)
-        painter.drawPath(inner_path)
+        return bell_path, QBrush(bell_grad), inner_path, QBrush(inner_grad)
 
-    def _draw_crown_groove(self, painter):
+    def _draw_crown_groove(self, painter, glow):
         """Draw the distinctive crown groove around bell middle."""
-        groove_y = -self.bell_radius * 0.3
-        groove_width = self.bell_radius * 0.95
+        # Groove geometry is static for a given bell radius
+        groove_path = self._groove_path
+        if groove_path is None:
+            groove_y = -self.bell_radius * 0.3
+            groove_width = self.bell_radius * 0.95
+            
+            groove_path = QPainterPath()
+            groove_path.moveTo(-groove_width, groove_y - 3)
+            groove_path.quadTo(0, groove_y + 5, groove_width, groove_y - 3)
+            groove_path.lineTo(groove_width, groove_y + 3)
+            groove_path.quadTo(0, groove_y + 8, -groove_width, groove_y + 3)
+            self._groove_path = groove_path
         
         # Groove shadow
-        groove_path = QPainterPath()
-        groove_path.moveTo(-groove_width, groove_y - 3)
-        groove_path.quadTo(0, groove_y + 5, groove_width, groove_y - 3)
-        groove_path.lineTo(groove_width, groove_y + 3)
-        groove_path.quadTo(0, groove_y + 8, -groove_width, groove_y + 3)
-        
         painter.setPen(Qt.NoPen)
-        painter.setBrush(QColor(30, 8, 15, 180))
+        painter.setBrush(self._qc_groove)
         painter.drawPath(groove_path)
         
         # Bioluminescent rim of groove
-        if self.glow_intensity > 0.05:
-            alpha = int(150 * self.glow_intensity)
-            painter.setPen(QPen(QColor(0, 200, 255, alpha), 2))
+        if glow > 0.05:
+            alpha = int(150 * glow)
+            painter.setPen(self._pen(self._qc_rim, alpha, 2))
             painter.setBrush(Qt.NoBrush)
             painter.drawPath(groove_path)
 
@@ -291,69 +579,65 @@ class BioluminescentJellyfishSkin:
         if self.glow_intensity < 0.1:
             # Subtle ambient ring
             alpha = int(30 + 20 * math.sin(self.time * 3))
-            painter.setPen(QPen(QColor(0, 180, 255, alpha), 1))
+            painter.setPen(self._pen(self._qc_ambient_ring, alpha, 1))
             painter.setBrush(Qt.NoBrush)
             painter.drawEllipse(QPointF(0, -self.bell_radius * 0.3), 
                               self.bell_radius * 0.6, self.bell_radius * 0.4)
             return
         
-        # Flash mode - expanding rings
-        num_rings = 4
-        for i in range(num_rings):
-            ring_progress = (self.flash_timer + i * 0.25) % 1.0
-            ring_radius = self.bell_radius * (0.3 + ring_progress * 0.8)
-            alpha = int(200 * (1 - ring_progress) * self.glow_intensity)
+        # Flash mode - expanding rings, evenly staggered so the inner and
+        # outer halves each hold two; each half is one path and one pen
+        center = QPointF(0, -self.bell_radius * 0.3)
+        painter.setBrush(Qt.NoBrush)
+        for band in range(FLASH_RING_BANDS):
+            band_path = QPainterPath()
+            band_progress = []
+            for i in range(NUM_FLASH_RINGS):
+                ring_progress = (self.flash_timer + i / NUM_FLASH_RINGS) % 1.0
+                if int(ring_progress * FLASH_RING_BANDS) != band:
+                    continue
+                ring_radius = self.bell_radius * (0.3 + ring_progress * 0.8)
+                # Slightly elliptical
+                band_path.addEllipse(center, ring_radius, ring_radius * 0.7)
+                band_progress.append(ring_progress)
             
+            if not band_progress:
+                continue
+            progress = sum(band_progress) / len(band_progress)
+            alpha = int(200 * (1 - progress) * self.glow_intensity)
             if alpha < 5:
                 continue
             
-            # Electric blue ring
-            painter.setPen(QPen(QColor(20, 220, 255, alpha), 3 - ring_progress * 2))
-            painter.setBrush(Qt.NoBrush)
-            
-            # Slightly elliptical
-            painter.drawEllipse(QPointF(0, -self.bell_radius * 0.3),
-                              ring_radius, ring_radius * 0.7)
+            # Electric blue rings
+            painter.setPen(self._pen(self._qc_ring, alpha, 3 - progress * 2))
+            painter.drawPath(band_path)
         
         # Center glow during flash
-        center_glow = QRadialGradient(0, -self.bell_radius * 0.3, self.bell_radius * 0.5)
-        center_glow.setColorAt(0.0, QColor(100, 240, 255, int(100 * self.glow_intensity)))
-        center_glow.setColorAt(0.5, QColor(0, 200, 255, int(60 * self.glow_intensity)))
-        center_glow.setColorAt(1.0, QColor(0, 0, 0, 0))
-        
-        painter.setPen(Qt.NoPen)
-        painter.setBrush(QBrush(center_glow))
-        painter.drawEllipse(QPointF(0, -self.bell_radius * 0.3),
-                          self.bell_radius * 0.5, self.bell_radius * 0.4)
+        center_y = -self.bell_radius * 0.3
+        transform = QTransform.fromScale(self.bell_radius * 0.5, self.bell_radius * 0.5)
+        self._center_glow_brush.setTransform(transform * QTransform.fromTranslate(0, center_y))
+        self._fill_faded(painter, self._center_glow_brush, self.glow_intensity,
+                         0, center_y, self.bell_radius * 0.5, self.bell_radius * 0.4)
 
-    def _draw_rhopalia(self, painter):
+    def _draw_rhopalia(self, painter, glow):
         """Draw rhopalia - sensory organs around bell margin."""
-        num_rhopalia = 8
-        margin_radius = self.bell_radius * 0.9
-        
-        for i in range(num_rhopalia):
-            angle = (i / num_rhopalia) * 2 * math.pi
-            rx = math.cos(angle) * margin_radius
-            ry = math.sin(angle) * margin_radius * 0.3  # Flattened
-            
-            # Rhopalium glows during flash
-            alpha = int(100 + 155 * self.glow_intensity)
-            painter.setBrush(QColor(0, 220, 255, alpha))
-            painter.setPen(Qt.NoPen)
-            painter.drawEllipse(QPointF(rx, ry), 2.5, 2)
+        # Rhopalia glow during flash; all share one color, so one fill
+        self._qc_rhopalia.setAlpha(int(100 + 155 * glow))
+        painter.setBrush(self._qc_rhopalia)
+        painter.setPen(Qt.NoPen)
+        painter.drawPath(self._rhopalia_path)
 
-    def _draw_oral_arms(self, painter, speed_factor):
+    def _draw_oral_arms(self, painter, speed_factor, frilled=True):
         """Draw oral arms - frilled appendages near mouth."""
-        num_arms = 4
         arm_length = self.bell_radius * 0.8
         
-        for i in range(num_arms):
+        # Arm sways (all arms at once)
+        sways = (np.sin(self.time * 1.5 + np.arange(NUM_ORAL_ARMS)) * 8).tolist()
+        
+        for i, sway in enumerate(sways):
             side = 1 if i % 2 == 0 else -1
             arm_offset = side * (5 + i * 3)
             
-            # Arm sways
-            sway = math.sin(self.time * 1.5 + i) * 8
-            
             arm_path = QPainterPath()
             arm_path.moveTo(arm_offset, 5)
             
@@ -366,20 +650,19 @@ class BioluminescentJellyfishSkin:
             arm_path.quadTo(ctrl_x, ctrl_y, end_x, end_y)
             
             # Frilled edge
-            for j in range(5):
-                t = j / 4
-                fx = arm_offset + (end_x - arm_offset) * t + side * 3 * math.sin(t * math.pi)
-                fy = 5 + (end_y - 5) * t
-                arm_path.lineTo(fx, fy)
+            if frilled:
+                for t, bulge in zip(_FRILL_T, _FRILL_BULGE):
+                    fx = arm_offset + (end_x - arm_offset) * t + side * bulge
+                    fy = 5 + (end_y - 5) * t
+                    arm_path.lineTo(fx, fy)
             
             arm_path.lineTo(end_x - side * 4, end_y)
             arm_path.quadTo(ctrl_x - side * 4, ctrl_y, arm_offset - side * 3, 5)
             
             # Arm gradient
-            arm_grad = QLinearGradient(arm_offset, 5, end_x, end_y)
-            arm_grad.setColorAt(0.0, QColor(100, 40, 60, 150))
-            arm_grad.setColorAt(0.5, QColor(80, 30, 50, 120))
-            arm_grad.setColorAt(1.0, QColor(60, 20, 40, 80))
+            arm_grad = self._arm_grads[i]
+            arm_grad.setStart(arm_offset, 5)
+            arm_grad.setFinalStop(end_x, end_y)
             
             painter.setPen(Qt.NoPen)
             painter.setBrush(QBrush(arm_grad))
@@ -387,41 +670,32 @@ class BioluminescentJellyfishSkin:
 
     def _draw_tentacles(self, painter, speed_factor):
         """Draw marginal tentacles."""
-        num_tentacles = 10
-        margin_radius = self.bell_radius * 0.9
-        
-        for i in range(num_tentacles):
-            angle = (i / num_tentacles) * 2 * math.pi
-            start_x = math.cos(angle) * margin_radius
-            start_y = math.sin(angle) * margin_radius * 0.3
+        segments = self._tentacle_segments
+        ts = _SEGMENT_T[segments]
+        
+        # All tentacles evaluated at once: rows are tentacles, columns are points
+        start_x = self._tentacle_start_x
+        start_y = self._tentacle_start_y
+        
+        # Tentacle sways with phase offset
+        phases = self.tentacle_sway[_TENTACLE_SWAY_INDEX]
+        lengths = self.tentacle_length * self._tentacle_length_scale
+        
+        pts = self._tent_bufs[segments]
+        _compute_tentacles(ts, phases, start_x, start_y, lengths, pts)
+        tentacles = [QPolygonF([QPointF(x, y) for x, y in row]) for row in pts.tolist()]
+        
+        # Draw with tapering thickness: each band (base/mid/tip) is one pen
+        # and one polyline per tentacle
+        edges = [round(b * segments / TENTACLE_BANDS) for b in range(TENTACLE_BANDS + 1)]
+        for j0, j1 in zip(edges, edges[1:]):
+            t = (j0 + j1) / (2 * segments)
+            thickness = 2.5 * (1 - t * 0.8)  # Taper to tip
+            alpha = int(120 * (1 - t * 0.7))
             
-            # Tentacle sways with phase offset
-            tentacle_phase = self.tentacle_sway[i % len(self.tentacle_sway)]
-            sway = math.sin(tentacle_phase) * 10
-            
-            tentacle_length = self.tentacle_length * (0.8 + 0.4 * math.sin(i * 0.7))
-            
-            # Draw tentacle as curved line with varying thickness
-            points = []
-            segments = 15
-            for j in range(segments + 1):
-                t = j / segments
-                tx = start_x + sway * t * t  # More sway at tip
-                ty = start_y + tentacle_length * t
-                # Undulation
-                undulation = math.sin(tentacle_phase + t * 4) * 3 * t
-                tx += undulation
-                points.append((tx, ty))
-            
-            # Draw with tapering thickness
-            for j in range(len(points) - 1):
-                t = j / segments
-                thickness = 2.5 * (1 - t * 0.8)  # Taper to tip
-                alpha = int(120 * (1 - t * 0.7))
-                
-                painter.setPen(QPen(QColor(140, 60, 80, alpha), thickness))
-                painter.drawLine(QPointF(points[j][0], points[j][1]),
-                               QPointF(points[j + 1][0], points[j + 1][1]))
+            painter.setPen(self._pen(self._qc_tent, alpha, thickness))
+            for polygon in tentacles:
+                painter.drawPolyline(polygon.mid(j0, j1 - j0 + 1))
 
     def _draw_trailing_tentacle(self, painter, speed_factor):
         """
@@ -435,43 +709,33 @@ class BioluminescentJellyfishSkin:
         
         tentacle_length = self.trailing_tentacle_length * (0.9 + 0.2 * math.sin(self.time * 0.5))
         
-        # Create flowing tentacle path
-        points = []
-        segments = 30
-        
-        for i in range(segments + 1):
-            t = i / segments
-            
-            # Base curve
-            base_x = start_x
-            base_y = start_y + tentacle_length * t
-            
-            # Flowing motion (sine waves)
-            wave1 = math.sin(self.trailing_tentacle_phase + t * 3) * 15 * t
-            wave2 = math.sin(self.trailing_tentacle_phase * 0.7 + t * 5) * 8 * t
-            wave3 = math.sin(self.time * 0.3 + t * 2) * 5 * t
-            
-            tx = base_x + wave1 + wave2 + wave3
-            ty = base_y
-            
-            points.append((tx, ty))
-        
-        # Draw with extreme taper
-        for i in range(len(points) - 1):
-            t = i / segments
+        # Create flowing tentacle path (all points at once)
+        segments = self._trailing_segments
+        ts = _SEGMENT_T[segments]
+        pts = self._trail_bufs[segments]
+        _compute_trailing(ts, self.trailing_tentacle_phase, self.time,
+                          start_x, start_y, tentacle_length, pts)
+        points = pts.tolist()
+        polygon = QPolygonF([QPointF(x, y) for x, y in points])
+        
+        # Bioluminescent tip during flash: one stroke under the tentacle
+        if self.flash_triggered and self.glow_intensity > 0.1:
+            j0 = math.floor(segments * TRAILING_GLOW_START) + 1
+            t = (j0 + segments) / (2 * segments)
+            glow_alpha = int(200 * self.glow_intensity * (t - TRAILING_GLOW_START) * 5)
+            painter.setPen(self._pen(self._qc_trail_glow, glow_alpha,
+                                     4.0 * (1 - t * 0.95) + 2))
+            painter.drawPolyline(polygon.mid(j0, segments - j0 + 1))
+        
+        # Draw with extreme taper, one pen per band
+        edges = [round(b * segments / TRAILING_BANDS) for b in range(TRAILING_BANDS + 1)]
+        for j0, j1 in zip(edges, edges[1:]):
+            t = (j0 + j1) / (2 * segments)
             thickness = 4.0 * (1 - t * 0.95)  # Very thin at tip
             alpha = int(100 * (1 - t * 0.6))
             
-            # Bioluminescent tip during flash
-            if t > 0.8 and self.glow_intensity > 0.1:
-                glow_alpha = int(200 * self.glow_intensity * (t - 0.8) * 5)
-                painter.setPen(QPen(QColor(50, 230, 255, glow_alpha), thickness + 2))
-                painter.drawLine(QPointF(points[i][0], points[i][1]),
-                               QPointF(points[i + 1][0], points[i + 1][1]))
-            
-            painter.setPen(QPen(QColor(160, 70, 90, alpha), max(0.5, thickness)))
-            painter.drawLine(QPointF(points[i][0], points[i][1]),
-                           QPointF(points[i + 1][0], points[i + 1][1]))
+            painter.setPen(self._pen(self._qc_trail, alpha, max(0.5, thickness)))
+            painter.drawPolyline(polygon.mid(j0, j1 - j0 + 1))
         
         # Bioluminescent nodes along tentacle
         if self.glow_intensity > 0.05:
@@ -481,6 +745,7 @@ class BioluminescentJellyfishSkin:
                 node_y = points[int(t * segments)][1]
                 node_alpha = int(150 * self.glow_intensity * (1 - t))
                 
-                painter.setBrush(QColor(0, 220, 255, node_alpha))
+                self._qc_node.setAlpha(node_alpha)
+                painter.setBrush(self._qc_node)
                 painter.setPen(Qt.NoPen)
                 painter.drawEllipse(QPointF(node_x, node_y), 2, 2)
@@ -0,0 +1,45 @@
+"""
+Bounded caches for per-frame render resources.
+Skins use these to keep quantized brushes, colors and pixmaps alive across
+frames instead of rebuilding identical Qt objects on every paint.
+"""
+
+from collections import OrderedDict
+
+
+class LRUCache:
+    """Mapping with a fixed capacity that evicts the least recently used entry."""
+
+    def __init__(self, maxsize: int = 128):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+
+    def get(self, key, default=None):
+        """Return the cached value for key (marking it recently used)."""
+        try:
+            value = self._data[key]
+        except KeyError:
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def put(self, key, value):
+        """Store value under key, evicting the oldest entry when full."""
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+        return value
+
+    def values(self):
+        """Cached values, oldest first, without changing their recency."""
+        return list(self._data.values())
+
+    def clear(self):
+        self._data.clear()
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __len__(self):
+        return len(self._data)
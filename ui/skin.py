@@ -15,12 +15,328 @@ Renders a photorealistic betta with:
 import math
 import random
 import numpy as np
+import shiboken6
 from PySide6.QtGui import (
-    QPainter, QColor, QPolygonF, QPen, QRadialGradient,
-    QLinearGradient, QPainterPath, QBrush, QConicalGradient
+    QPainter, QColor, QPixmap, QPolygonF, QPen, QRadialGradient,
+    QLinearGradient, QPainterPath, QBrush, QConicalGradient, QTransform
 )
-from PySide6.QtCore import QPointF, Qt
-from engine.perlin import PerlinNoise
+from PySide6.QtCore import QLineF, QPointF, QRectF, Qt
+from engine.perlin import PerlinNoise, noise2d_kernel
+from utils.jit import HAS_NUMBA, njit
+from ui.render_cache import LRUCache
+
+# Fin sampling resolution
+CAUDAL_RAYS = 32
+DORSAL_POINTS = 20
+ANAL_POINTS = 16
+VENTRAL_POINTS = 18
+
+# Scale rows following body contour: (y_offset, num_cols, start_x)
+_SCALE_ROWS = [
+    (-7, 5, 7),
+    (0, 8, 10),
+    (7, 7, 8),
+]
+_SCALE_X = np.array([start_x - col_idx * 6.5
+                     for _, num_cols, start_x in _SCALE_ROWS for col_idx in range(num_cols)])
+_SCALE_Y = np.array([float(y_off)
+                     for y_off, num_cols, _ in _SCALE_ROWS for _ in range(num_cols)])
+# Noise-space scale positions: shimmer samples (drifting with time) and
+# iridescence samples
+_SCALE_SHIMMER_X = _SCALE_X * 0.1
+_SCALE_SHIMMER_Y = _SCALE_Y * 0.1
+_SCALE_IRID_X = _SCALE_X * 0.05
+_SCALE_IRID_Y = _SCALE_Y * 0.05
+# Crescent outline of a scale relative to its center: a start point and the
+# control/end points of the upper and lower cubics
+_SCALE_START = (-2.5, 0.0)
+_SCALE_CURVE = np.array([[-1.5, -2.8], [1.5, -2.8], [2.5, 0.0],
+                         [1.2, -1.0], [-1.2, -1.0], [-2.5, 0.0]])
+
+# Eye placement on the head
+EYE_X, EYE_Y = 22.6, -4.1
+EYE_R = 5.15
+
+_TRANSPARENT = QColor(0, 0, 0, 0)
+
+# Iris colors are built per 1/EYE_STRESS_STEPS of stress (hunger and mood)
+EYE_STRESS_STEPS = 64
+
+# Fixed eye colors; like the sclera these ignore the skin opacity
+_PUPIL_STOPS = ((0.0, QColor(2, 2, 2, 250)), (0.7, QColor(8, 5, 3, 245)), (1.0, QColor(15, 10, 8, 235)))
+_EYE_GLINT_MAIN = QColor(255, 255, 255, 215)
+_EYE_GLINT_SMALL = QColor(255, 255, 255, 128)
+_EYE_GLINT_TINY = QColor(255, 255, 255, 86)
+# Area of the eye sprite (eyelid shadow, dark ring and sclera) relative to
+# the eye center, in fish units with a margin for antialiasing
+_EYE_SPRITE_RECT = QRectF(-7.5, -7.0, 15.0, 14.0)
+# Area of the glint sprite (the three corneal highlights) relative to the iris
+_GLINT_SPRITE_RECT = QRectF(-2.0, -3.5, 6.0, 6.0)
+# Area average of a calm eye (sclera, iris and pupil), for eyes too small to resolve
+_EYE_FLAT = QColor(110, 105, 115, 250)
+# (cos, sin) of the iris texture line angles, every 20 degrees
+_IRIS_DIRS = tuple((math.cos(math.radians(a)), math.sin(math.radians(a))) for a in range(0, 360, 20))
+
+# Radius (at size_scale 1) around the fish origin that covers the glow and the
+# widest fin sweep at any heading; used to skip drawing off-screen fish
+CULL_RADIUS = 240.0
+
+# Body glow: peak alpha, and the radius its sprite is baked at (the live glow
+# breathes between 53 and 71 and is drawn by stretching the sprite)
+GLOW_ALPHA = 22
+GLOW_SPRITE_RADIUS = 62.0
+# Sprite area in fish units: the glow ellipse is centered 5 units behind the
+# origin with half the height 0.6 of its radius
+_GLOW_SPRITE_RECT = QRectF(-5 - GLOW_SPRITE_RADIUS, -GLOW_SPRITE_RADIUS * 0.6,
+                           GLOW_SPRITE_RADIUS * 2, GLOW_SPRITE_RADIUS * 1.2)
+
+# Scale fills are batched by color: alpha is rounded down to a multiple of
+# SCALE_ALPHA_MASK + 1 and tint strength to 1/SCALE_TINT_STEPS
+SCALE_ALPHA_MASK = 7
+SCALE_TINT_STEPS = 8
+
+# Iridescence shifts at which a scale's color changes: the +-0.2 tint
+# thresholds and every tint-strength rounding step past them. A shift maps to
+# a color through one np.searchsorted into the per-palette table between these.
+_IRID_POS_EDGES = [0.2] + [e for e in ((k + 0.5) * 2 / SCALE_TINT_STEPS
+                                       for k in range(SCALE_TINT_STEPS)) if e > 0.2]
+_IRID_EDGES = np.array([-e for e in reversed(_IRID_POS_EDGES)] + _IRID_POS_EDGES)
+# One shift inside each interval, used to fill the table
+_IRID_SAMPLES = np.concatenate((
+    [_IRID_EDGES[0] - 1.0], (_IRID_EDGES[:-1] + _IRID_EDGES[1:]) / 2, [_IRID_EDGES[-1] + 1.0]
+))
+
+# Body outline, lateral line and rim paths are cached per 1/BODY_FLEX_STEPS of flex
+BODY_FLEX_STEPS = 8
+
+# At or below this on-screen scale the faint sub-pixel details (fin rays and
+# body scales) are drawn without antialiasing; larger fish keep it
+LOD_AA_DETAIL_SCALE = 1.0
+
+# On-screen eye radius in pixels below which the eye is a single flat dot,
+# and below which the iris texture and the two small glints are skipped
+LOD_EYE_FLAT_RADIUS = 1.5
+LOD_EYE_DETAIL_RADIUS = 3.0
+
+# Constant per-sample coefficients along each fin (t grid, base x, envelopes)
+_CAUDAL_T = np.arange(1, CAUDAL_RAYS + 1) / CAUDAL_RAYS
+_CAUDAL_CURVE = 1.0 + 0.15 * np.sin(_CAUDAL_T * np.pi)  # Halfmoon spread bulge
+
+_DORSAL_T = np.arange(DORSAL_POINTS + 1) / DORSAL_POINTS
+_DORSAL_BX = 18 + (-26 - 18) * _DORSAL_T
+_DORSAL_ENV = np.sin(_DORSAL_T * np.pi) ** 0.6 * (1.0 - _DORSAL_T * 0.2)
+
+_ANAL_T = np.arange(ANAL_POINTS + 1) / ANAL_POINTS
+_ANAL_BX = 8 + (-28 - 8) * _ANAL_T
+_ANAL_ENV = np.sin(_ANAL_T * np.pi) ** 0.7
+
+_VENTRAL_T = np.arange(1, VENTRAL_POINTS + 1) / VENTRAL_POINTS
+
+# Octave-noise sample coordinates for every fin, sampled in one batch per frame:
+# caudal upper and lower edges, dorsal, anal, then the two ventral fins.
+# y is time * _FIN_NOISE_Y_RATE + _FIN_NOISE_Y_OFFSET.
+_FIN_NOISE_X = np.concatenate((
+    _CAUDAL_T * 4.0, _CAUDAL_T * 4.0 + 10.0, _DORSAL_T * 5.0 + 5.0, _ANAL_T * 4.0 + 20.0,
+    _VENTRAL_T * 3.5 - 30.0, _VENTRAL_T * 3.5 + 30.0,
+))
+_FIN_NOISE_Y_RATE = np.concatenate((
+    np.full(2 * CAUDAL_RAYS, 1.2), np.full(DORSAL_POINTS + 1, 1.0), np.full(ANAL_POINTS + 1, 1.1),
+    np.full(2 * VENTRAL_POINTS, 0.8),
+))
+_FIN_NOISE_Y_OFFSET = np.concatenate((
+    np.zeros(2 * CAUDAL_RAYS + DORSAL_POINTS + ANAL_POINTS + 2),
+    np.full(VENTRAL_POINTS, -5.0), np.full(VENTRAL_POINTS, 5.0),
+))
+_CAUDAL_CENTER_NOISE_X = _CAUDAL_T * 3.0
+
+# Membrane layers as (alpha, scale toward the fin base, edge offset) per fin
+_CAUDAL_LAYERS = ((90, 1.0, 0), (60, 0.85, 2), (35, 0.65, 5))
+_CAUDAL_LAYER_SCALES = np.array([scale for _, scale, _ in _CAUDAL_LAYERS])
+# Upper edge moves up and lower edge down by the layer offset
+_CAUDAL_LAYER_OFFSETS = (np.array([offset for _, _, offset in _CAUDAL_LAYERS], dtype=float)[:, None]
+                         * np.repeat([-1.0, 1.0], CAUDAL_RAYS + 1))
+_DORSAL_LAYERS = ((110, 1.0), (55, 0.7))
+_DORSAL_LAYER_SCALES = np.array([scale for _, scale in _DORSAL_LAYERS])
+_DORSAL_OUTLINE_X = np.concatenate(([18.0], _DORSAL_BX, [-26.0]))
+_ANAL_LAYERS = ((100, 1.0), (45, 0.65))
+_ANAL_LAYER_SCALES = np.array([scale for _, scale in _ANAL_LAYERS])
+_ANAL_OUTLINE_X = np.concatenate(([8.0], _ANAL_BX, [-28.0]))
+_VENTRAL_LAYERS = ((75, 1.0), (35, 0.6))
+_VENTRAL_LAYER_SCALES = np.array([scale for _, scale in _VENTRAL_LAYERS])
+_VENTRAL_X = np.concatenate(([8.0], 8 - _VENTRAL_T * 40))
+
+# Frame-invariant values for the per-ray drawing loops, as plain Python numbers
+# so the loops never convert or index NumPy arrays
+_CAUDAL_RAY_ALPHAS = tuple((i, int(35 * (1.0 - i / CAUDAL_RAYS * 0.5)))  # Fade toward edges
+                           for i in range(2, CAUDAL_RAYS, 2))
+_CAUDAL_FILAMENTS = tuple(range(max(4, CAUDAL_RAYS - 7), CAUDAL_RAYS + 1, 2))
+_DORSAL_RAY_X = _DORSAL_BX[1:DORSAL_POINTS:2].tolist()
+_ANAL_RAY_X = _ANAL_BX[1:ANAL_POINTS:2].tolist()
+_VENTRAL_RAY_X = _VENTRAL_X[2::3].tolist()
+
+# (palette attribute, phase offset) pairs passed to _shifted_color each frame
+_SHIFTED_COLOR_KEYS = (
+    ("primary", 0.0), ("primary", 0.5), ("primary", 1.5), ("primary", 3.0),
+    ("secondary", 1.5), ("secondary", 2.0),
+    ("accent", 0.8), ("accent", 1.0), ("accent", 2.5),
+)
+_SHIFTED_OFFSETS = np.array([offset for _, offset in _SHIFTED_COLOR_KEYS])
+
+# Fixed blends of the palette used by the head, rim and detail layers, as
+# name -> (color, color, t); a color is a palette attribute name or an RGB list.
+# Resolved by _derive_palette only when the palette changes.
+_PALETTE_BLENDS = {
+    "cheek_hot": ("accent", [220, 255, 255], 0.45),
+    "cheek_warm": ("primary", "accent", 0.35),
+    "jaw_shadow": ("primary", [30, 20, 20], 0.45),
+    "rim": ("accent", [255, 255, 255], 0.45),
+    "caudal_ray": ("primary", [255, 255, 255], 0.3),
+    "gill_seam": ("primary", [0, 0, 0], 0.15),
+    "operculum_inner": ("primary", [18, 16, 24], 0.38),
+    "operculum_outer": ("primary", [18, 16, 24], 0.54),
+    "lip": ("primary", [0, 0, 0], 0.34),
+    "eyelid": ("primary", [16, 14, 18], 0.45),
+    "eye_ring": ("primary", [0, 0, 0], 0.5),
+    "pale_scale": ([255, 255, 255], "primary", 0.3),
+}
+
+
+def _wave_table(t, k):
+    """sin and cos of t * k, for evaluating sin(phase - t * k) by angle subtraction."""
+    return np.stack((np.sin(t * k), np.cos(t * k)))
+
+
+# Travelling-wave tables along each fin; the t grids and wave numbers never change
+_CAUDAL_WAVE = _wave_table(_CAUDAL_T, 2.8)
+_CAUDAL_WAVE2 = _wave_table(_CAUDAL_T, 4.0)
+_DORSAL_WAVE = _wave_table(_DORSAL_T, 2.5)
+_DORSAL_WAVE2 = _wave_table(_DORSAL_T, 3.5)
+_ANAL_WAVE = _wave_table(_ANAL_T, 2.4)
+_VENTRAL_WAVE = _wave_table(_VENTRAL_T, 1.6)
+
+
+@njit(cache=True)
+def _travelling_sin(phase, table):
+    """sin(phase - t * k) for every sample of a _wave_table."""
+    return math.sin(phase) * table[1] - math.cos(phase) * table[0]
+
+
+@njit(cache=True)
+def _compute_fin_geometry(tail_phase, speed_factor, tail_amp, state_boost, swim_cadence,
+                          turn_intensity, noise, center_noise, caudal, dorsal, anal, ventral):
+    """Fill the fin edge y buffers for one frame from the batched noise samples.
+
+    caudal rows are the upper, lower and center edges; ventral rows are the
+    upper (side -1) and lower (side +1) fins.
+    """
+    n_caudal = caudal.shape[1]
+    n_dorsal = dorsal.shape[0]
+    n_anal = anal.shape[0]
+    n_ventral = ventral.shape[1]
+
+    # Caudal: halfmoon spread plus a large sweeping wave and a smaller, faster one
+    t = _CAUDAL_T
+    noise_u = noise[:n_caudal] * 14 * t
+    noise_l = noise[n_caudal:2 * n_caudal] * 14 * t
+    noise_c = center_noise * 8 * t
+    wave = _travelling_sin(tail_phase, _CAUDAL_WAVE) * (8 + t * 24) * (0.5 + speed_factor * 0.52) * tail_amp * state_boost
+    wave2 = _travelling_sin(tail_phase * 1.7, _CAUDAL_WAVE2) * (3 + t * 8)
+    spread_curve = t * (58 + turn_intensity * 4.0) * _CAUDAL_CURVE
+    caudal[0, :] = -spread_curve + wave + wave2 + noise_u
+    caudal[1, :] = spread_curve + wave + wave2 + noise_l
+    caudal[2, :] = wave + noise_c
+    start = 2 * n_caudal
+
+    # Dorsal: taller peak envelope, asymmetric (higher toward front)
+    t = _DORSAL_T
+    envelope = _DORSAL_ENV
+    base_height = (40 + swim_cadence * 4.0) * envelope
+    fin_noise = noise[start:start + n_dorsal] * 6 * envelope
+    wave = _travelling_sin(tail_phase * 0.6, _DORSAL_WAVE) * (3 + 7.6 * speed_factor) * envelope * (0.9 + tail_amp * 0.28) * state_boost
+    wave2 = _travelling_sin(tail_phase * 1.3, _DORSAL_WAVE2) * 2 * envelope
+    dorsal[:] = -13 - base_height + wave + wave2 + fin_noise
+    start += n_dorsal
+
+    # Anal
+    t = _ANAL_T
+    envelope = _ANAL_ENV
+    base_depth = (30 + swim_cadence * 2.6) * envelope
+    fin_noise = noise[start:start + n_anal] * 5 * envelope
+    wave = _travelling_sin(tail_phase * 0.7, _ANAL_WAVE) * (3 + 6.8 * speed_factor) * envelope * (0.9 + tail_amp * 0.24) * state_boost
+    anal[:] = 12 + base_depth + wave + fin_noise
+    start += n_anal
+
+    # Ventral pair, mirrored with a small phase offset
+    t = _VENTRAL_T
+    for k in range(2):
+        side = 2.0 * k - 1.0
+        fin_noise = noise[start:start + n_ventral] * 8 * t
+        wave = _travelling_sin(tail_phase * 0.5 + side * 0.4, _VENTRAL_WAVE) * (4 + 10 * speed_factor) * t * (0.9 + tail_amp * 0.2)
+        ventral[k, :] = side * (9 + t * 42) + wave + fin_noise
+        start += n_ventral
+
+
+@njit(cache=True, fastmath=True)
+def _compute_scale_fills(t, shimmer_base, shimmer_perm, irid_perm, fills):
+    """Packed fill key of every scale (see _draw_scales), noise included.
+
+    Loops per scale calling the Perlin kernel directly, so it is only used
+    when compiled; plain NumPy takes the vectorized path instead.
+    """
+    n_edges = _IRID_EDGES.shape[0]
+    for i in range(fills.shape[0]):
+        shimmer = noise2d_kernel(_SCALE_SHIMMER_X[i] + t * 0.8, _SCALE_SHIMMER_Y[i] + t * 0.3, shimmer_perm)
+        alpha = int(shimmer_base + shimmer * 25)
+        alpha = 0 if alpha < 0 else 60 if alpha > 60 else alpha
+        shift = noise2d_kernel(_SCALE_IRID_X[i], _SCALE_IRID_Y[i] + t * 0.5, irid_perm)
+        idx = 0
+        while idx < n_edges and _IRID_EDGES[idx] < shift:
+            idx += 1
+        fills[i] = idx << 6 | (alpha & ~SCALE_ALPHA_MASK)
+
+
+def _layer_outlines(xs, ys, pivot, scales, offsets=0.0):
+    """(layers, points, 2) fin outlines with ys scaled toward pivot per layer."""
+    out = np.empty((len(scales), len(xs), 2))
+    out[:, :, 0] = xs
+    out[:, :, 1] = pivot + (ys - pivot) * scales[:, None] + offsets
+    return out
+
+
+def _direct_polygon_fill_works():
+    """Whether QPolygonF stores points as (x, y) double pairs we can write in place.
+
+    Checked once at import with a write that stays inside a 2-point buffer
+    even if qreal were a 4-byte float, so a wrong layout is detected instead
+    of corrupting the heap.
+    """
+    try:
+        polygon = QPolygonF()
+        polygon.resize(2)
+        storage = shiboken6.VoidPtr(polygon.data(), 16, True)
+        np.frombuffer(storage, dtype=np.float64)[:] = (1.5, -2.25)
+        first, second = polygon[0], polygon[1]
+    except Exception:
+        return False
+    return (first.x(), first.y(), second.x(), second.y()) == (1.5, -2.25, 0.0, 0.0)
+
+
+_DIRECT_POLYGON_FILL = _direct_polygon_fill_works()
+
+
+def _polygon(points):
+    """QPolygonF from an (N, 2) array of points, copied straight into its storage."""
+    n = len(points)
+    if n == 0:
+        return QPolygonF()
+    if not _DIRECT_POLYGON_FILL:
+        return QPolygonF([QPointF(x, y) for x, y in np.asarray(points).tolist()])
+    polygon = QPolygonF()
+    polygon.resize(n)
+    # QPolygonF keeps its points as contiguous (x, y) doubles
+    storage = shiboken6.VoidPtr(polygon.data(), n * 16, True)
+    np.frombuffer(storage, dtype=np.float64).reshape(n, 2)[:] = points
+    return polygon
 
 
 class FishSkin:
@@ -61,9 +377,16 @@ class FishSkin:
             for name in selected[:count]
         ]
 
+    # Frame-invariant shapes shared by all instances, see _init_static_parts
+    _highlight_path = None
+    _highlight_brush = None
+    _sclera_brush = None
+    _sclera_pen = None
+    _scale_paths = None
+
     def __init__(self, config=None):
-        self.perlin = PerlinNoise(seed=42)
-        self.perlin2 = PerlinNoise(seed=137)  # Second noise for variety
+        self.perlin = PerlinNoise.shared(42)
+        self.perlin2 = PerlinNoise.shared(137)  # Second noise for variety
         self.time = 0.0
         self.tail_phase = 0.0
         self.glow_phase = 0.0
@@ -93,9 +416,91 @@ class FishSkin:
         self.turn_intensity = 0.0
         self.swim_cadence = 0.0
         self._facing_left = False
+        self.lod = 1.0  # On-screen scale of the last render
+        self._smooth_details = False
+
+        # Geometry and brushes that never change between frames
+        self._init_static_parts()
+
+        # Per-frame fin edge y coordinates, see _compute_fin_geometry
+        self._caudal_y = np.empty((3, CAUDAL_RAYS))
+        self._dorsal_y = np.empty(DORSAL_POINTS + 1)
+        self._anal_y = np.empty(ANAL_POINTS + 1)
+        self._ventral_y = np.empty((2, VENTRAL_POINTS))
+
+        # Scratch paths reused (cleared) for the per-frame fin layers and
+        # the per-color scale batches (at most one per scale)
+        self._fin_path = QPainterPath()
+        self._scale_batch_paths = [QPainterPath() for _ in range(len(_SCALE_X))]
+        # Per-frame packed scale fills, see _draw_scales
+        self._scale_fills = np.empty(len(_SCALE_X), dtype=np.int64)
+
+        # Shifted palette colors for the current frame, see _compute_color_table
+        self._frame_colors = {}
+        # Fixed palette blends, scale colors per _IRID_EDGES interval, and the
+        # palette they were derived from
+        self._palette_blends = {}
+        self._irid_lut = None
+        self._palette_key = None
+        self._qcolor_cache = LRUCache(maxsize=512)
+        self._pen_cache = LRUCache(maxsize=128)
+        # Last gradient brush per draw slot, see _linear_brush/_radial_brush
+        self._gradient_brushes = {}
+        # Body paths per quantized flex, see _body_paths
+        self._body_path_cache = LRUCache(maxsize=256)
+        # Baked body glow per glow color, see _glow_sprite
+        self._glow_sprites = LRUCache(maxsize=32)
+        # Eye base layers per palette and resolution, see _eye_sprite
+        self._eye_sprites = LRUCache(maxsize=8)
+        # Corneal highlights per resolution, see _glint_sprite
+        self._glint_sprites = LRUCache(maxsize=4)
+        # Iris gradients per stress step and the unit-radius pupil gradient;
+        # both are placed each frame through the brush transform
+        self._iris_brushes = LRUCache(maxsize=EYE_STRESS_STEPS + 1)
+        pupil_grad = QRadialGradient(0, 0, 1.0)
+        for pos, color in _PUPIL_STOPS:
+            pupil_grad.setColorAt(pos, color)
+        self._pupil_brush = QBrush(pupil_grad)
+        # Iris texture pen, recolored in place when the iris color changes
+        self._iris_line_pen = QPen(_TRANSPARENT, 0.2)
+        self._iris_line_rgb = None
 
         if config:
             self.apply_config(config)
+        self._derive_palette()
+
+    @classmethod
+    def _init_static_parts(cls):
+        """Build the frame-invariant paths and brushes once, shared by every fish."""
+        if cls._highlight_path is not None:
+            return
+        cls._highlight_path = QPainterPath()
+        cls._highlight_path.moveTo(26, -5)
+        cls._highlight_path.cubicTo(18, -10, 4, -11, -8, -9)
+        cls._highlight_path.cubicTo(4, -8, 18, -7, 26, -5)
+        h_grad = QLinearGradient(10, -12, 10, -5)
+        h_grad.setColorAt(0.0, QColor(255, 255, 255, 45))
+        h_grad.setColorAt(0.5, QColor(255, 255, 255, 25))
+        h_grad.setColorAt(1.0, QColor(255, 255, 255, 0))
+        cls._highlight_brush = QBrush(h_grad)
+
+        sclera_grad = QRadialGradient(EYE_X, EYE_Y, EYE_R)
+        sclera_grad.setColorAt(0.0, QColor(248, 245, 242, 240))
+        sclera_grad.setColorAt(0.7, QColor(235, 228, 220, 235))
+        sclera_grad.setColorAt(1.0, QColor(200, 190, 180, 220))
+        cls._sclera_brush = QBrush(sclera_grad)
+        cls._sclera_pen = QPen(QColor(60, 55, 50, 180), 0.5)
+
+        # Crescent outline of every body scale; only their colors animate
+        cls._scale_paths = []
+        centers = np.stack([_SCALE_X, _SCALE_Y], axis=1)
+        curves = (centers[:, None, :] + _SCALE_CURVE).reshape(len(centers), 12)
+        for (sx, sy), curve in zip(centers.tolist(), curves.tolist()):
+            scale_path = QPainterPath()
+            scale_path.moveTo(sx + _SCALE_START[0], sy + _SCALE_START[1])
+            scale_path.cubicTo(*curve[:6])
+            scale_path.cubicTo(*curve[6:])
+            cls._scale_paths.append(scale_path)
 
     def apply_config(self, config):
         fish_cfg = config.get("fish") if hasattr(config, "get") and callable(config.get) else {}
@@ -147,9 +552,10 @@ class FishSkin:
             return default
         return max(minimum, min(maximum, parsed))
 
-    def _compute_eye_look(self, vx, vy):
+    def _compute_eye_look(self, vx, vy, speed=None):
         """Smoothed eye tracking offsets to avoid robotic micro-jitter."""
-        speed = math.sqrt(vx * vx + vy * vy)
+        if speed is None:
+            speed = math.hypot(vx, vy)
         look_scale = self.eye_tracking_strength * min(1.0, speed / 180.0)
 
         if speed > 1e-6:
@@ -165,40 +571,132 @@ class FishSkin:
         return self._eye_look_x, self._eye_look_y
 
     def _lerp_color(self, c1, c2, t):
-        t = max(0.0, min(1.0, t))
-        return [int(c1[i] + (c2[i] - c1[i]) * t) for i in range(3)]
+        t = 0.0 if t < 0.0 else 1.0 if t > 1.0 else t
+        return [int(c1[0] + (c2[0] - c1[0]) * t),
+                int(c1[1] + (c2[1] - c1[1]) * t),
+                int(c1[2] + (c2[2] - c1[2]) * t)]
 
     def _shifted_color(self, base, phase_offset=0.0):
+        cached = self._frame_colors.get((id(base), phase_offset))
+        if cached is not None:
+            return cached
         t = (math.sin(self.color_shift_phase + phase_offset) + 1.0) / 2.0
         shifted = self._lerp_color(base, self.secondary, t * (0.25 + self.turn_intensity * 0.18 + self.swim_cadence * 0.08))
         return shifted
 
-    def _make_color(self, rgb, alpha=255):
-        return QColor(
-            max(0, min(255, rgb[0])),
-            max(0, min(255, rgb[1])),
-            max(0, min(255, rgb[2])),
-            max(0, min(255, int(alpha * self.opacity)))
-        )
+    def _compute_color_table(self):
+        """Shift every palette color the layers use this frame in one pass."""
+        bases = [getattr(self, name) for name, _ in _SHIFTED_COLOR_KEYS]
+        base_rgb = np.array([base[:3] for base in bases], dtype=float)
+        t = (np.sin(self.color_shift_phase + _SHIFTED_OFFSETS) + 1.0) / 2.0
+        t = np.clip(t * (0.25 + self.turn_intensity * 0.18 + self.swim_cadence * 0.08), 0.0, 1.0)
+        secondary = np.array(self.secondary[:3], dtype=float)
+        shifted = (base_rgb + (secondary - base_rgb) * t[:, None]).astype(int).tolist()
+        return {
+            (id(base), offset): rgb
+            for base, (_, offset), rgb in zip(bases, _SHIFTED_COLOR_KEYS, shifted)
+        }
+
+    def _derive_palette(self):
+        """Refresh the _PALETTE_BLENDS colors if the palette changed since the last frame."""
+        key = (*self.primary[:3], *self.secondary[:3], *self.accent[:3])
+        if key == self._palette_key:
+            return
+        self._palette_key = key
+        self._palette_blends = {
+            name: self._lerp_color(
+                getattr(self, c1) if isinstance(c1, str) else c1,
+                getattr(self, c2) if isinstance(c2, str) else c2, t)
+            for name, (c1, c2, t) in _PALETTE_BLENDS.items()
+        }
+        self._irid_lut = self._irid_colors(_IRID_SAMPLES).tolist()
+
+    def _irid_colors(self, irid_shifts):
+        """Scale RGB for each iridescence shift, as an int array of shape (n, 3)."""
+        # Cyan tint above +0.2, magenta below -0.2, pale primary in between
+        primary = np.array(self.primary[:3], dtype=float)
+        tint = np.where((irid_shifts > 0.2)[:, None], [200.0, 255.0, 255.0], [255.0, 200.0, 255.0])
+        strength = np.round(np.minimum(np.abs(irid_shifts) * 0.5, 1.0) * SCALE_TINT_STEPS) / SCALE_TINT_STEPS
+        colors = (primary + (tint - primary) * strength[:, None]).astype(int)
+        colors[np.abs(irid_shifts) <= 0.2] = self._palette_blends["pale_scale"]
+        return colors
+
+    def _rgba_key(self, rgb, alpha):
+        """Clamped color with opacity applied, packed as 0xRRGGBBAA."""
+        # Called ~100 times a frame; conditional expressions avoid the
+        # max()/min() call overhead
+        r = int(rgb[0])
+        g = int(rgb[1])
+        b = int(rgb[2])
+        a = int(alpha * self.opacity)
+        r = 0 if r < 0 else 255 if r > 255 else r
+        g = 0 if g < 0 else 255 if g > 255 else g
+        b = 0 if b < 0 else 255 if b > 255 else b
+        a = 0 if a < 0 else 255 if a > 255 else a
+        return (r << 24) | (g << 16) | (b << 8) | a
 
-    def render(self, painter, local_pos, fish_state):
-        x, y = local_pos
+    def _make_color(self, rgb, alpha=255):
+        key = self._rgba_key(rgb, alpha)
+        color = self._qcolor_cache.get(key)
+        if color is None:
+            color = self._qcolor_cache.put(
+                key, QColor(key >> 24, (key >> 16) & 255, (key >> 8) & 255, key & 255))
+        return color
+
+    def _pen(self, rgb, alpha, width):
+        """Shared QPen for a color (as for _make_color) and stroke width."""
+        key = (self._rgba_key(rgb, alpha), width)
+        pen = self._pen_cache.get(key)
+        if pen is None:
+            pen = self._pen_cache.put(key, QPen(self._make_color(rgb, alpha), width))
+        return pen
+
+    def _linear_brush(self, slot, x1, y1, x2, y2, stops):
+        """Linear gradient brush for slot, rebuilt only when geometry or stops change.
+
+        stops is a tuple of (position, QColor) pairs; colors from _make_color
+        are shared objects, so an unchanged frame compares by identity.
+        """
+        key = (x1, y1, x2, y2, stops)
+        cached = self._gradient_brushes.get(slot)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        gradient = QLinearGradient(x1, y1, x2, y2)
+        for pos, color in stops:
+            gradient.setColorAt(pos, color)
+        brush = QBrush(gradient)
+        self._gradient_brushes[slot] = (key, brush)
+        return brush
+
+    def _radial_brush(self, slot, cx, cy, radius, stops):
+        """Radial counterpart of _linear_brush."""
+        key = (cx, cy, radius, stops)
+        cached = self._gradient_brushes.get(slot)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        gradient = QRadialGradient(cx, cy, radius)
+        for pos, color in stops:
+            gradient.setColorAt(pos, color)
+        brush = QBrush(gradient)
+        self._gradient_brushes[slot] = (key, brush)
+        return brush
+
+    def advance(self, fish_state, speed=None, speed_factor=None):
+        """Step the animation by one frame without drawing.
+
+        Everything paint() reads besides fish_state (phases, body flex, frame
+        colors, facing, eye look) is updated here.
+        """
         vx, vy = fish_state["velocity"]
-        speed = math.sqrt(vx * vx + vy * vy)
-
-        if abs(vx) < 0.1 and abs(vy) < 0.1:
-            angle = math.degrees(fish_state.get("facing_angle", 0))
-        else:
-            angle = math.degrees(math.atan2(vy, vx))
-
-        hunger = fish_state.get("hunger", 0)
-        mood = fish_state.get("mood", 100)
+        if speed is None:
+            speed = math.hypot(vx, vy)
+        if speed_factor is None:
+            speed_factor = min(speed / 120.0, 2.5)
         state = fish_state.get("state", "IDLE")
         state_boost = 1.15 if state in {"DARTING", "FLARING"} else 1.0
 
         # Animation timing
         dt = 0.033
-        speed_factor = min(speed / 120.0, 2.5)
         self.tail_amp_factor = fish_state.get("tail_amp_factor", 1.0)
         self.tail_freq_factor = fish_state.get("tail_freq_factor", 1.0)
         self.turn_intensity = fish_state.get("turn_intensity", 0.0)
@@ -217,14 +715,56 @@ class FishSkin:
         # Body S-curve flex
         self.body_flex_target = math.sin(self.tail_phase * 0.4) * (3.0 + speed_factor * 5.0 + self.turn_intensity * 2.2) * (0.8 + self.tail_amp_factor * 0.35)
         self.body_flex += (self.body_flex_target - self.body_flex) * 0.12
+        self._frame_colors = self._compute_color_table()
+        self._derive_palette()
 
-        sc = self.size_scale
         # Hysteresis on left/right facing avoids flip jitter near +/-90°.
         if vx < -2.0:
             self._facing_left = True
         elif vx > 2.0:
             self._facing_left = False
+
+        self._compute_eye_look(vx, vy, speed)
+
+    def render(self, painter, local_pos, fish_state):
+        """Advance one frame and draw it."""
+        vx, vy = fish_state["velocity"]
+        speed = math.hypot(vx, vy)
+        self.advance(fish_state, speed)
+        self.paint(painter, local_pos, fish_state, speed)
+
+    def paint(self, painter, local_pos, fish_state, speed=None):
+        """Draw the current frame without advancing the animation.
+
+        A second view of the same tick (e.g. another monitor sector) can
+        call this after render() to draw an identical fish.
+        """
+        x, y = local_pos
+        vx, vy = fish_state["velocity"]
+        if speed is None:
+            speed = math.hypot(vx, vy)
+        speed_factor = min(speed / 120.0, 2.5)
+
+        # Heading only needs atan2 while moving; a resting fish keeps its facing
+        if speed < 0.1:
+            angle = math.degrees(fish_state.get("facing_angle", 0))
+        else:
+            angle = math.degrees(math.atan2(vy, vx))
+
+        hunger = fish_state.get("hunger", 0)
+        mood = fish_state.get("mood", 100)
+        sc = self.size_scale
         flipped = self._facing_left
+        eye_look_x, eye_look_y = self._eye_look_x, self._eye_look_y
+
+        reach = CULL_RADIUS * abs(sc)
+        if not self._is_visible(painter, QRectF(x - reach, y - reach, 2 * reach, 2 * reach)):
+            return
+
+        # Effective on-screen scale includes any transform the caller applied
+        transform = painter.worldTransform()
+        self.lod = abs(sc) * math.hypot(transform.m11(), transform.m12())
+        self._smooth_details = self.lod > LOD_AA_DETAIL_SCALE
 
         painter.save()
         painter.setRenderHint(QPainter.Antialiasing, True)
@@ -237,6 +777,8 @@ class FishSkin:
             painter.rotate(angle)
             painter.scale(sc, sc)
 
+        self._update_fin_geometry(speed_factor)
+
         # Render layers back to front
         self._draw_glow(painter, mood)
         self._draw_caudal_fin(painter, speed_factor)
@@ -246,7 +788,6 @@ class FishSkin:
         self._draw_dorsal_fin(painter, speed_factor)
         self._draw_pectoral_fins(painter, speed_factor)
         self._draw_gill_plate(painter)
-        eye_look_x, eye_look_y = self._compute_eye_look(vx, vy)
         self._draw_eye(painter, mood, hunger, eye_look_x, eye_look_y)
         self._draw_scales(painter, speed_factor)
         self._draw_cheek_iridescence(painter)
@@ -255,30 +796,83 @@ class FishSkin:
 
         painter.restore()
 
+    @staticmethod
+    def _is_visible(painter, rect):
+        """Whether rect (in painter coordinates) overlaps the area being painted."""
+        if painter.hasClipping():
+            return painter.clipBoundingRect().intersects(rect)
+        return painter.worldTransform().mapRect(rect).intersects(QRectF(painter.viewport()))
+
+    def _update_fin_geometry(self, speed_factor):
+        """Sample all fin noise in one batch and refresh the fin edge buffers."""
+        noise = self.perlin.octave_noise_array(
+            _FIN_NOISE_X, self.time * _FIN_NOISE_Y_RATE + _FIN_NOISE_Y_OFFSET, octaves=3)
+        center_noise = self.perlin2.noise2d_array(_CAUDAL_CENTER_NOISE_X, self.time * 1.0)
+        _compute_fin_geometry(
+            self.tail_phase, speed_factor, self.tail_amp_factor, self._state_boost,
+            self.swim_cadence, self.turn_intensity, noise, center_noise,
+            self._caudal_y, self._dorsal_y, self._anal_y, self._ventral_y,
+        )
+
     # ---- GLOW ----
     def _draw_glow(self, painter, mood):
         if not self.enable_glow:
             return
         glow_size = 62 + math.sin(self.glow_phase) * 9
         breath = math.sin(self.breath_phase) * 0.25 + 0.75
-        glow_alpha = int(22 * breath * (mood / 100.0))
-        col = self._shifted_color(self.primary, 0.5)
-
-        gradient = QRadialGradient(0, 0, glow_size)
-        gradient.setColorAt(0.0, self._make_color(col, glow_alpha))
-        gradient.setColorAt(0.3, self._make_color(col, int(glow_alpha * 0.5)))
-        gradient.setColorAt(0.7, self._make_color(col, int(glow_alpha * 0.15)))
-        gradient.setColorAt(1.0, QColor(0, 0, 0, 0))
-
-        painter.setPen(Qt.NoPen)
-        painter.setBrush(QBrush(gradient))
-        painter.drawEllipse(QPointF(-5, 0), glow_size, glow_size * 0.6)
+        glow_alpha = int(GLOW_ALPHA * breath * (mood / 100.0))
+        if int(glow_alpha * self.opacity) < 1:
+            return  # Every stop would be fully transparent
+        sprite = self._glow_sprite(self._shifted_color(self.primary, 0.5))
+
+        # The sprite holds the glow at peak alpha and the reference radius;
+        # breathing is painter opacity and a stretched target rect
+        k = glow_size / GLOW_SPRITE_RADIUS
+        r = _GLOW_SPRITE_RECT
+        opacity = painter.opacity()
+        painter.setRenderHint(QPainter.SmoothPixmapTransform, True)
+        painter.setOpacity(opacity * glow_alpha / GLOW_ALPHA)
+        painter.drawPixmap(QRectF(r.x() * k, r.y() * k, r.width() * k, r.height() * k),
+                           sprite, QRectF(sprite.rect()))
+        painter.setOpacity(opacity)
+
+    def _glow_sprite(self, col):
+        """Glow ellipse for col at peak alpha, baked at one pixel per fish unit."""
+        key = self._rgba_key(col, GLOW_ALPHA)
+        sprite = self._glow_sprites.get(key)
+        if sprite is not None:
+            return sprite
+        r = _GLOW_SPRITE_RECT
+        sprite = QPixmap(math.ceil(r.width()), math.ceil(r.height()))
+        sprite.fill(Qt.GlobalColor.transparent)
+
+        gradient = QRadialGradient(0, 0, GLOW_SPRITE_RADIUS)
+        gradient.setColorAt(0.0, self._make_color(col, GLOW_ALPHA))
+        gradient.setColorAt(0.3, self._make_color(col, int(GLOW_ALPHA * 0.5)))
+        gradient.setColorAt(0.7, self._make_color(col, int(GLOW_ALPHA * 0.15)))
+        gradient.setColorAt(1.0, _TRANSPARENT)
+
+        sprite_painter = QPainter(sprite)
+        sprite_painter.setRenderHint(QPainter.Antialiasing, True)
+        sprite_painter.scale(sprite.width() / r.width(), sprite.height() / r.height())
+        sprite_painter.translate(-r.x(), -r.y())
+        sprite_painter.setPen(Qt.NoPen)
+        sprite_painter.setBrush(QBrush(gradient))
+        sprite_painter.drawEllipse(QPointF(-5, 0), GLOW_SPRITE_RADIUS, GLOW_SPRITE_RADIUS * 0.6)
+        sprite_painter.end()
+        return self._glow_sprites.put(key, sprite)
 
     # ---- BODY ----
-    def _draw_body(self, painter, hunger, mood, speed_factor):
-        col = self._shifted_color(self.primary)
-        alpha = int(220 + (mood / 100.0) * 35)
-        flex = self.body_flex
+    def _body_paths(self):
+        """(outline, lateral line, rim) paths for the current body flex.
+
+        Cached per 1/BODY_FLEX_STEPS of flex; the paths do not depend on color.
+        """
+        key = round(self.body_flex * BODY_FLEX_STEPS)
+        paths = self._body_path_cache.get(key)
+        if paths is not None:
+            return paths
+        flex = key / BODY_FLEX_STEPS
 
         body_path = QPainterPath()
         # Anatomically accurate teardrop: pointed mouth, wide mid-body, tapered peduncle
@@ -309,83 +903,85 @@ class FishSkin:
             32, 0
         )
 
+        lat_path = QPainterPath()
+        lat_path.moveTo(24, 0)
+        lat_path.cubicTo(12, -1 + flex * 0.2, -10, 0 + flex * 0.3, -30, 0)
+
+        rim = QPainterPath()
+        rim.moveTo(31.5, -0.3)
+        rim.cubicTo(27.0, -7 + flex * 0.2, 10, -14 + flex * 0.3, -24, -11 + flex * 0.2)
+        rim.cubicTo(-31, -6 + flex * 0.1, -37, -2, -38, 0)
+        rim.cubicTo(-37, 2, -31, 6 - flex * 0.1, -24, 11 - flex * 0.2)
+        rim.cubicTo(10, 14 - flex * 0.3, 27, 7 - flex * 0.2, 31.5, 0.3)
+
+        return self._body_path_cache.put(key, (body_path, lat_path, rim))
+
+    def _draw_body(self, painter, hunger, mood, speed_factor):
+        col = self._shifted_color(self.primary)
+        alpha = int(220 + (mood / 100.0) * 35)
+        body_path, lat_path, _ = self._body_paths()
+
         # Multi-stop gradient for realistic shading
-        body_grad = QLinearGradient(0, -18, 0, 18)
         lighter = self._lerp_color(col, [255, 255, 255], 0.2)
         darker = self._lerp_color(col, [0, 0, 20], 0.3)
         belly = self._lerp_color(col, [255, 255, 255], 0.35)
-        body_grad.setColorAt(0.0, self._make_color(lighter, alpha))
-        body_grad.setColorAt(0.25, self._make_color(col, alpha))
-        body_grad.setColorAt(0.5, self._make_color(darker, alpha))
-        body_grad.setColorAt(0.75, self._make_color(col, alpha))
-        body_grad.setColorAt(1.0, self._make_color(belly, int(alpha * 0.95)))
+        body_color = self._make_color(col, alpha)
+        body_brush = self._linear_brush("body", 0, -18, 0, 18, (
+            (0.0, self._make_color(lighter, alpha)),
+            (0.25, body_color),
+            (0.5, self._make_color(darker, alpha)),
+            (0.75, body_color),
+            (1.0, self._make_color(belly, int(alpha * 0.95))),
+        ))
 
         # Subtle dark outline
         outline_col = self._lerp_color(col, [0, 0, 0], 0.4)
-        painter.setPen(QPen(self._make_color(outline_col, 100), 0.7))
-        painter.setBrush(QBrush(body_grad))
+        painter.setPen(self._pen(outline_col, 100, 0.7))
+        painter.setBrush(body_brush)
         painter.drawPath(body_path)
 
         # Lateral line (subtle dark line along midline)
-        painter.setPen(QPen(self._make_color(self._lerp_color(col, [0, 0, 0], 0.2), 40), 0.5))
-        lat_path = QPainterPath()
-        lat_path.moveTo(24, 0)
-        lat_path.cubicTo(12, -1 + flex * 0.2, -10, 0 + flex * 0.3, -30, 0)
+        painter.setPen(self._pen(self._lerp_color(col, [0, 0, 0], 0.2), 40, 0.5))
         painter.drawPath(lat_path)
 
     def _draw_body_highlight(self, painter):
         """Wet specular highlight along the body."""
-        highlight = QPainterPath()
-        highlight.moveTo(26, -5)
-        highlight.cubicTo(18, -10, 4, -11, -8, -9)
-        highlight.cubicTo(4, -8, 18, -7, 26, -5)
-
         painter.setPen(Qt.NoPen)
-        h_grad = QLinearGradient(10, -12, 10, -5)
-        h_grad.setColorAt(0.0, QColor(255, 255, 255, 45))
-        h_grad.setColorAt(0.5, QColor(255, 255, 255, 25))
-        h_grad.setColorAt(1.0, QColor(255, 255, 255, 0))
-        painter.setBrush(QBrush(h_grad))
-        painter.drawPath(highlight)
+        painter.setBrush(self._highlight_brush)
+        painter.drawPath(self._highlight_path)
 
     def _draw_cheek_iridescence(self, painter):
         """Subtle gill-cheek iridescence patch for real betta face depth."""
-        grad = QRadialGradient(15.5, -2.5, 8.0)
-        grad.setColorAt(0.0, self._make_color(self._lerp_color(self.accent, [220, 255, 255], 0.45), 58))
-        grad.setColorAt(0.55, self._make_color(self._lerp_color(self.primary, self.accent, 0.35), 32))
-        grad.setColorAt(1.0, QColor(0, 0, 0, 0))
         painter.setPen(Qt.NoPen)
-        painter.setBrush(QBrush(grad))
+        painter.setBrush(self._radial_brush("cheek", 15.5, -2.5, 8.0, (
+            (0.0, self._make_color(self._palette_blends["cheek_hot"], 58)),
+            (0.55, self._make_color(self._palette_blends["cheek_warm"], 32)),
+            (1.0, _TRANSPARENT),
+        )))
         painter.drawEllipse(QPointF(15.2, -2.0), 7.4, 5.6)
 
         # Subtle maxilla highlight near mouth for stronger head read.
-        jaw_grad = QRadialGradient(27.5, 0.0, 4.8)
-        jaw_grad.setColorAt(0.0, self._make_color([250, 240, 232], 30))
-        jaw_grad.setColorAt(0.7, self._make_color(self._lerp_color(self.primary, [30, 20, 20], 0.45), 18))
-        jaw_grad.setColorAt(1.0, QColor(0, 0, 0, 0))
-        painter.setBrush(QBrush(jaw_grad))
+        painter.setBrush(self._radial_brush("jaw", 27.5, 0.0, 4.8, (
+            (0.0, self._make_color([250, 240, 232], 30)),
+            (0.7, self._make_color(self._palette_blends["jaw_shadow"], 18)),
+            (1.0, _TRANSPARENT),
+        )))
         painter.drawEllipse(QPointF(27.2, -0.2), 4.2, 2.8)
 
     # ---- CAUDAL (TAIL) FIN ----
     def _draw_silhouette_rim(self, painter, speed_factor):
         """Crisp rim light to improve Uno outline readability on mixed desktops."""
-        rim = QPainterPath()
-        flex = self.body_flex
-        rim.moveTo(31.5, -0.3)
-        rim.cubicTo(27.0, -7 + flex * 0.2, 10, -14 + flex * 0.3, -24, -11 + flex * 0.2)
-        rim.cubicTo(-31, -6 + flex * 0.1, -37, -2, -38, 0)
-        rim.cubicTo(-37, 2, -31, 6 - flex * 0.1, -24, 11 - flex * 0.2)
-        rim.cubicTo(10, 14 - flex * 0.3, 27, 7 - flex * 0.2, 31.5, 0.3)
+        _, _, rim = self._body_paths()
 
         rim_alpha = int((32 + 16 * min(1.0, speed_factor * 0.55 + self.turn_intensity * 0.6)) * self.silhouette_strength)
-        rim_col = self._lerp_color(self.accent, [255, 255, 255], 0.45)
-        painter.setPen(QPen(self._make_color(rim_col, rim_alpha), 0.9))
+        rim_col = self._palette_blends["rim"]
+        painter.setPen(self._pen(rim_col, rim_alpha, 0.9))
         painter.setBrush(Qt.NoBrush)
         painter.drawPath(rim)
 
     def _draw_caudal_fin(self, painter, speed_factor):
         """Massive halfmoon caudal fin with translucent membrane and ray structure."""
-        num_rays = 32
+        num_rays = CAUDAL_RAYS
         fin_length = 68 + self.swim_cadence * 3.0
         fin_spread = 58 + self.turn_intensity * 4.0  # Halfmoon = wide spread
 
@@ -393,275 +989,180 @@ class FishSkin:
         col_mid = self._shifted_color(self.primary, 1.5)
         col_bot = self._shifted_color(self.secondary, 2.0)
 
-        # Generate upper and lower edges with organic waviness
-        upper_points = [QPointF(-28, -4)]
-        lower_points = [QPointF(-28, 4)]
-        center_points = [QPointF(-28, 0)]
-
-        for i in range(1, num_rays + 1):
-            t = i / num_rays
-            px = -28 - t * fin_length
-
-            # Multi-octave noise for realistic membrane ripple
-            noise_u = self.perlin.octave_noise(t * 4.0, self.time * 1.2, octaves=3) * 14 * t
-            noise_l = self.perlin.octave_noise(t * 4.0 + 10.0, self.time * 1.2, octaves=3) * 14 * t
-            noise_c = self.perlin2.noise2d(t * 3.0, self.time * 1.0) * 8 * t
+        # Upper, lower and center edges with organic waviness (all rays at once)
+        edge_x = np.concatenate(([-28.0], -28 - _CAUDAL_T * fin_length))
+        upper_y, lower_y, center_y = np.concatenate(([[-4.0], [4.0], [0.0]], self._caudal_y), axis=1)
 
-            # Primary wave: large sweeping motion
-            wave = math.sin(self.tail_phase - t * 2.8) * (8 + t * 24) * (0.5 + speed_factor * 0.52) * self.tail_amp_factor * self._state_boost
-            # Secondary wave: smaller, faster
-            wave2 = math.sin(self.tail_phase * 1.7 - t * 4.0) * (3 + t * 8)
-
-            spread = t * fin_spread
-            # Halfmoon shape: spread increases then slightly curves back
-            spread_curve = spread * (1.0 + 0.15 * math.sin(t * math.pi))
-
-            upper_points.append(QPointF(px, -spread_curve + wave + wave2 + noise_u))
-            lower_points.append(QPointF(px, spread_curve + wave + wave2 + noise_l))
-            center_points.append(QPointF(px, wave + noise_c))
+        # Every membrane layer outline (upper edge, then lower edge back) in one pass
+        outlines = _layer_outlines(
+            np.concatenate((edge_x, edge_x[::-1])), np.concatenate((upper_y, lower_y[::-1])),
+            0.0, _CAUDAL_LAYER_SCALES, _CAUDAL_LAYER_OFFSETS)
+        outlines[:, 0, 1] = upper_y[0]  # Every layer starts at the unscaled upper root
+        polygons = [_polygon(outline) for outline in outlines]
 
         # Draw multiple translucent membrane layers for depth
-        for layer in range(3):
-            layer_alpha = [90, 60, 35][layer]
-            layer_scale = [1.0, 0.85, 0.65][layer]
-            layer_offset = [0, 2, 5][layer]
-
-            fin_path = QPainterPath()
-            fin_path.moveTo(upper_points[0])
-
-            for i in range(1, len(upper_points)):
-                p = upper_points[i]
-                scaled_y = p.y() * layer_scale - layer_offset
-                fin_path.lineTo(QPointF(p.x(), scaled_y))
-
-            for i in range(len(lower_points) - 1, -1, -1):
-                p = lower_points[i]
-                scaled_y = p.y() * layer_scale + layer_offset
-                fin_path.lineTo(QPointF(p.x(), scaled_y))
-            fin_path.closeSubpath()
-
+        col_mid_light = self._lerp_color(col_mid, [255, 255, 255], 0.15)
+        for (layer_alpha, _, _), polygon in zip(_CAUDAL_LAYERS, polygons):
             # Gradient across the fin
-            fin_grad = QLinearGradient(-28, -fin_spread, -28, fin_spread)
-            fin_grad.setColorAt(0.0, self._make_color(col_top, layer_alpha))
-            fin_grad.setColorAt(0.3, self._make_color(col_mid, int(layer_alpha * 0.85)))
-            fin_grad.setColorAt(0.5, self._make_color(
-                self._lerp_color(col_mid, [255, 255, 255], 0.15), int(layer_alpha * 0.7)))
-            fin_grad.setColorAt(0.7, self._make_color(col_mid, int(layer_alpha * 0.85)))
-            fin_grad.setColorAt(1.0, self._make_color(col_bot, layer_alpha))
-
+            mid_color = self._make_color(col_mid, int(layer_alpha * 0.85))
             painter.setPen(Qt.NoPen)
-            painter.setBrush(QBrush(fin_grad))
-            painter.drawPath(fin_path)
+            painter.setBrush(self._linear_brush(
+                ("caudal", layer_alpha), -28, -fin_spread, -28, fin_spread, (
+                    (0.0, self._make_color(col_top, layer_alpha)),
+                    (0.3, mid_color),
+                    (0.5, self._make_color(col_mid_light, int(layer_alpha * 0.7))),
+                    (0.7, mid_color),
+                    (1.0, self._make_color(col_bot, layer_alpha)),
+                )))
+            painter.drawPolygon(polygon)
 
         # Fin ray lines (branching structure)
-        for i in range(2, num_rays, 2):
-            t = i / num_rays
-            # Ray opacity fades toward edges
-            ray_alpha = int(35 * (1.0 - t * 0.5))
-            ray_col = self._lerp_color(self.primary, [255, 255, 255], 0.3)
-            painter.setPen(QPen(self._make_color(ray_col, ray_alpha), 0.4))
-
-            # Upper ray
-            painter.drawLine(upper_points[0], upper_points[i])
-            # Center ray
-            painter.drawLine(center_points[0], center_points[i])
-            # Lower ray
-            painter.drawLine(lower_points[0], lower_points[i])
-
-        # Delicate edge highlight
-        painter.setPen(QPen(self._make_color([255, 255, 255], 20), 0.6))
+        xs = edge_x.tolist()
+        ups = upper_y.tolist()
+        los = lower_y.tolist()
+        cens = center_y.tolist()
+        ray_col = self._palette_blends["caudal_ray"]
+        x0, up0, cen0, lo0 = xs[0], ups[0], cens[0], los[0]
+        pen_for, set_pen, draw_lines = self._pen, painter.setPen, painter.drawLines
+        painter.setRenderHint(QPainter.Antialiasing, self._smooth_details)
+        for i, ray_alpha in _CAUDAL_RAY_ALPHAS:
+            set_pen(pen_for(ray_col, ray_alpha, 0.4))
+
+            # Upper, center and lower ray
+            x = xs[i]
+            draw_lines([
+                QLineF(x0, up0, x, ups[i]),
+                QLineF(x0, cen0, x, cens[i]),
+                QLineF(x0, lo0, x, los[i]),
+            ])
+        painter.setRenderHint(QPainter.Antialiasing, True)
+
+        # Delicate edge highlight: the full-size layer outline is the upper
+        # edge followed by the lower edge from its tip back to the root
+        painter.setPen(self._pen([255, 255, 255], 20, 0.6))
         edge_path = QPainterPath()
-        edge_path.moveTo(upper_points[0])
-        for p in upper_points[1:]:
-            edge_path.lineTo(p)
+        edge_path.addPolygon(polygons[0].mid(0, num_rays + 1))
+        edge_path.addPolygon(polygons[0].mid(num_rays + 1, num_rays + 1))
         painter.drawPath(edge_path)
 
-        edge_path2 = QPainterPath()
-        edge_path2.moveTo(lower_points[0])
-        for p in lower_points[1:]:
-            edge_path2.lineTo(p)
-        painter.drawPath(edge_path2)
-
         # Trailing filament tips for premium halfmoon silhouette.
-        painter.setPen(QPen(self._make_color(self._lerp_color(col_top, [255, 255, 255], 0.5), 20), 0.55))
-        for idx in range(max(4, num_rays - 7), num_rays + 1, 2):
-            p_up = upper_points[idx]
-            p_lo = lower_points[idx]
-            painter.drawLine(p_up, QPointF(p_up.x() - 4.0, p_up.y() - 2.0))
-            painter.drawLine(p_lo, QPointF(p_lo.x() - 4.0, p_lo.y() + 2.0))
+        painter.setPen(self._pen(self._lerp_color(col_top, [255, 255, 255], 0.5), 20, 0.55))
+        filaments = []
+        for idx in _CAUDAL_FILAMENTS:
+            x = xs[idx]
+            filaments.append(QLineF(x, ups[idx], x - 4.0, ups[idx] - 2.0))
+            filaments.append(QLineF(x, los[idx], x - 4.0, los[idx] + 2.0))
+        painter.drawLines(filaments)
 
     # ---- DORSAL FIN ----
     def _draw_dorsal_fin(self, painter, speed_factor):
         """Tall flowing dorsal fin with membrane transparency and ray branching."""
-        num_pts = 20
+        num_pts = DORSAL_POINTS
         col = self._shifted_color(self.accent, 0.8)
 
-        base_start_x = 18
-        base_end_x = -26
-
-        points = []
-        for i in range(num_pts + 1):
-            t = i / num_pts
-            bx = base_start_x + (base_end_x - base_start_x) * t
-
-            # Taller peak envelope, asymmetric (higher toward front)
-            envelope = math.sin(t * math.pi) ** 0.6 * (1.0 - t * 0.2)
-            base_height = (40 + self.swim_cadence * 4.0) * envelope
+        tip_y = self._dorsal_y
 
-            noise = self.perlin.octave_noise(t * 5.0 + 5.0, self.time * 1.0, octaves=3) * 6 * envelope
-            wave = math.sin(self.tail_phase * 0.6 - t * 2.5) * (3 + 7.6 * speed_factor) * envelope * (0.9 + self.tail_amp_factor * 0.28) * self._state_boost
-            wave2 = math.sin(self.tail_phase * 1.3 - t * 3.5) * 2 * envelope
-
-            points.append(QPointF(bx, -13 - base_height + wave + wave2 + noise))
+        outlines = _layer_outlines(
+            _DORSAL_OUTLINE_X, np.concatenate(([-11.0], tip_y, [-11.0])), -11.0, _DORSAL_LAYER_SCALES)
 
         # Two layers for translucency effect
-        for layer, (l_alpha, l_scale) in enumerate([(110, 1.0), (55, 0.7)]):
-            fin_path = QPainterPath()
-            fin_path.moveTo(base_start_x, -11)
-            for p in points:
-                y = -11 + (p.y() - (-11)) * l_scale
-                fin_path.lineTo(QPointF(p.x(), y))
-            fin_path.lineTo(base_end_x, -11)
-            fin_path.closeSubpath()
-
-            fin_grad = QLinearGradient(0, -52, 0, -11)
-            fin_grad.setColorAt(0.0, self._make_color(col, int(l_alpha * 0.5)))
-            fin_grad.setColorAt(0.4, self._make_color(
-                self._lerp_color(col, self.primary, 0.4), int(l_alpha * 0.8)))
-            fin_grad.setColorAt(1.0, self._make_color(self.primary, l_alpha))
-
+        for (l_alpha, _), outline in zip(_DORSAL_LAYERS, outlines):
             painter.setPen(Qt.NoPen)
-            painter.setBrush(QBrush(fin_grad))
-            painter.drawPath(fin_path)
+            painter.setBrush(self._linear_brush(("dorsal", l_alpha), 0, -52, 0, -11, (
+                (0.0, self._make_color(col, int(l_alpha * 0.5))),
+                (0.4, self._make_color(self._lerp_color(col, self.primary, 0.4), int(l_alpha * 0.8))),
+                (1.0, self._make_color(self.primary, l_alpha)),
+            )))
+            painter.drawPolygon(_polygon(outline))
 
         # Fin rays with branching
-        painter.setPen(QPen(self._make_color([255, 255, 255], 20), 0.35))
-        for i in range(1, num_pts, 2):
-            t = i / num_pts
-            bx = base_start_x + (base_end_x - base_start_x) * t
-            painter.drawLine(QPointF(bx, -11), points[i])
+        painter.setRenderHint(QPainter.Antialiasing, self._smooth_details)
+        painter.setPen(self._pen([255, 255, 255], 20, 0.35))
+        rays = []
+        for bx, tip_y_i in zip(_DORSAL_RAY_X, tip_y[1:num_pts:2].tolist()):
+            rays.append(QLineF(bx, -11, bx, tip_y_i))
             # Branch at 60% height
-            if i + 1 <= num_pts:
-                mid_x = bx + (points[i].x() - bx) * 0.6
-                mid_y = -11 + (points[i].y() - (-11)) * 0.6
-                painter.drawLine(QPointF(mid_x, mid_y), QPointF(mid_x + 3, mid_y - 4))
+            mid_y = -11 + (tip_y_i - (-11)) * 0.6
+            rays.append(QLineF(bx, mid_y, bx + 3, mid_y - 4))
+        painter.drawLines(rays)
+        painter.setRenderHint(QPainter.Antialiasing, True)
 
         # Edge highlight
-        painter.setPen(QPen(self._make_color(self._lerp_color(col, [255, 255, 255], 0.3), 25), 0.5))
+        painter.setPen(self._pen(self._lerp_color(col, [255, 255, 255], 0.3), 25, 0.5))
         edge = QPainterPath()
-        edge.moveTo(points[0])
-        for p in points[1:]:
-            edge.lineTo(p)
+        edge.addPolygon(_polygon(np.column_stack((_DORSAL_BX, tip_y))))
         painter.drawPath(edge)
 
     # ---- ANAL FIN ----
     def _draw_anal_fin(self, painter, speed_factor):
         """Flowing anal fin with translucent membrane."""
-        num_pts = 16
+        num_pts = ANAL_POINTS
         col = self._shifted_color(self.secondary, 1.5)
 
-        base_start_x = 8
-        base_end_x = -28
+        tip_y = self._anal_y
 
-        points = []
-        for i in range(num_pts + 1):
-            t = i / num_pts
-            bx = base_start_x + (base_end_x - base_start_x) * t
-
-            envelope = math.sin(t * math.pi) ** 0.7
-            base_depth = (30 + self.swim_cadence * 2.6) * envelope
-
-            noise = self.perlin.octave_noise(t * 4.0 + 20.0, self.time * 1.1, octaves=3) * 5 * envelope
-            wave = math.sin(self.tail_phase * 0.7 - t * 2.4) * (3 + 6.8 * speed_factor) * envelope * (0.9 + self.tail_amp_factor * 0.24) * self._state_boost
-
-            points.append(QPointF(bx, 12 + base_depth + wave + noise))
-
-        for layer, (l_alpha, l_scale) in enumerate([(100, 1.0), (45, 0.65)]):
-            fin_path = QPainterPath()
-            fin_path.moveTo(base_start_x, 10)
-            for p in points:
-                y = 10 + (p.y() - 10) * l_scale
-                fin_path.lineTo(QPointF(p.x(), y))
-            fin_path.lineTo(base_end_x, 10)
-            fin_path.closeSubpath()
-
-            fin_grad = QLinearGradient(0, 10, 0, 42)
-            fin_grad.setColorAt(0.0, self._make_color(self.primary, l_alpha))
-            fin_grad.setColorAt(0.5, self._make_color(
-                self._lerp_color(col, self.primary, 0.3), int(l_alpha * 0.8)))
-            fin_grad.setColorAt(1.0, self._make_color(col, int(l_alpha * 0.5)))
+        outlines = _layer_outlines(
+            _ANAL_OUTLINE_X, np.concatenate(([10.0], tip_y, [10.0])), 10.0, _ANAL_LAYER_SCALES)
 
+        for (l_alpha, _), outline in zip(_ANAL_LAYERS, outlines):
             painter.setPen(Qt.NoPen)
-            painter.setBrush(QBrush(fin_grad))
-            painter.drawPath(fin_path)
+            painter.setBrush(self._linear_brush(("anal", l_alpha), 0, 10, 0, 42, (
+                (0.0, self._make_color(self.primary, l_alpha)),
+                (0.5, self._make_color(self._lerp_color(col, self.primary, 0.3), int(l_alpha * 0.8))),
+                (1.0, self._make_color(col, int(l_alpha * 0.5))),
+            )))
+            painter.drawPolygon(_polygon(outline))
 
         # Rays
-        painter.setPen(QPen(self._make_color([255, 255, 255], 16), 0.3))
-        for i in range(1, num_pts, 2):
-            t = i / num_pts
-            bx = base_start_x + (base_end_x - base_start_x) * t
-            painter.drawLine(QPointF(bx, 10), points[i])
+        painter.setRenderHint(QPainter.Antialiasing, self._smooth_details)
+        painter.setPen(self._pen([255, 255, 255], 16, 0.3))
+        painter.drawLines([
+            QLineF(bx, 10, bx, tip_y_i)
+            for bx, tip_y_i in zip(_ANAL_RAY_X, tip_y[1:num_pts:2].tolist())
+        ])
+        painter.setRenderHint(QPainter.Antialiasing, True)
 
     # ---- VENTRAL FINS ----
     def _draw_ventral_fins(self, painter, speed_factor):
         """Long, elegant trailing ventral fins with transparency gradient."""
         col = self._shifted_color(self.accent, 2.5)
 
-        for side in [-1, 1]:
-            num_pts = 18
-            points = [QPointF(8, side * 9)]
-
-            for i in range(1, num_pts + 1):
-                t = i / num_pts
-
-                noise = self.perlin.octave_noise(
-                    t * 3.5 + side * 30.0, self.time * 0.8 + side * 5.0, octaves=3
-                ) * 8 * t
-                wave = math.sin(self.tail_phase * 0.5 - t * 1.6 + side * 0.4) * (4 + 10 * speed_factor) * t * (0.9 + self.tail_amp_factor * 0.2)
+        for side, fin_y in zip((-1, 1), self._ventral_y):
+            py = np.concatenate(([side * 9.0], fin_y))
 
-                px = 8 - t * 40
-                py = side * (9 + t * 42) + wave + noise
-
-                points.append(QPointF(px, py))
+            # Width-scaled copies of the fin for every layer at once
+            layer_points = _layer_outlines(_VENTRAL_X, py, side * 9.0, _VENTRAL_LAYER_SCALES).tolist()
 
             # Multiple transparency layers
-            for layer in range(2):
-                l_alpha = [75, 35][layer]
-                l_width = [1.0, 0.6][layer]
-
-                fin_path = QPainterPath()
-                fin_path.moveTo(points[0])
-                for i in range(1, len(points) - 1, 2):
-                    ctrl = points[i]
-                    end = points[min(i + 1, len(points) - 1)]
-                    # Scale width
-                    ctrl_y = points[0].y() + (ctrl.y() - points[0].y()) * l_width
-                    end_y = points[0].y() + (end.y() - points[0].y()) * l_width
-                    fin_path.quadTo(QPointF(ctrl.x(), ctrl_y), QPointF(end.x(), end_y))
-                if len(points) % 2 == 0:
-                    p = points[-1]
-                    fin_path.lineTo(QPointF(p.x(), points[0].y() + (p.y() - points[0].y()) * l_width))
+            for (l_alpha, _), pts in zip(_VENTRAL_LAYERS, layer_points):
+                fin_path = self._fin_path
+                fin_path.clear()
+                fin_path.moveTo(*pts[0])
+                quad_to = fin_path.quadTo
+                for i in range(1, len(pts) - 1, 2):
+                    quad_to(*pts[i], *pts[i + 1])
+                if len(pts) % 2 == 0:
+                    fin_path.lineTo(*pts[-1])
 
                 fin_path.lineTo(QPointF(10, side * 7))
                 fin_path.closeSubpath()
 
                 # Gradient fading toward tips
-                fy_start = side * 9
-                fy_end = side * 50
-                fin_grad = QLinearGradient(0, fy_start, 0, fy_end)
-                fin_grad.setColorAt(0.0, self._make_color(self.primary, l_alpha))
-                fin_grad.setColorAt(0.3, self._make_color(col, int(l_alpha * 0.9)))
-                fin_grad.setColorAt(0.7, self._make_color(col, int(l_alpha * 0.5)))
-                fin_grad.setColorAt(1.0, self._make_color(col, int(l_alpha * 0.15)))
-
                 painter.setPen(Qt.NoPen)
-                painter.setBrush(QBrush(fin_grad))
+                painter.setBrush(self._linear_brush(("ventral", side, l_alpha), 0, side * 9, 0, side * 50, (
+                    (0.0, self._make_color(self.primary, l_alpha)),
+                    (0.3, self._make_color(col, int(l_alpha * 0.9))),
+                    (0.7, self._make_color(col, int(l_alpha * 0.5))),
+                    (1.0, self._make_color(col, int(l_alpha * 0.15))),
+                )))
                 painter.drawPath(fin_path)
 
             # Delicate ray lines
-            painter.setPen(QPen(self._make_color([255, 255, 255], 12), 0.25))
-            for i in range(2, len(points), 3):
-                painter.drawLine(points[0], points[i])
+            painter.setRenderHint(QPainter.Antialiasing, self._smooth_details)
+            painter.setPen(self._pen([255, 255, 255], 12, 0.25))
+            painter.drawLines([QLineF(8.0, side * 9.0, x, y)
+                               for x, y in zip(_VENTRAL_RAY_X, py[2::3].tolist())])
+            painter.setRenderHint(QPainter.Antialiasing, True)
 
     # ---- PECTORAL FINS ----
     def _draw_pectoral_fins(self, painter, speed_factor):
@@ -686,34 +1187,33 @@ class FishSkin:
                 QPointF(12, 3 * side_mult)
             )
 
-            fin_grad = QRadialGradient(12, 10 * side_mult, 16)
-            fin_grad.setColorAt(0.0, self._make_color(col, 80))
-            fin_grad.setColorAt(0.5, self._make_color(col, 50))
-            fin_grad.setColorAt(1.0, self._make_color(col, 15))
-
-            painter.setPen(QPen(self._make_color(col, 30), 0.3))
-            painter.setBrush(QBrush(fin_grad))
+            painter.setPen(self._pen(col, 30, 0.3))
+            painter.setBrush(self._radial_brush(("pectoral", side_mult), 12, 10 * side_mult, 16, (
+                (0.0, self._make_color(col, 80)),
+                (0.5, self._make_color(col, 50)),
+                (1.0, self._make_color(col, 15)),
+            )))
             painter.drawPath(fin_path)
 
     # ---- GILL PLATE ----
     def _draw_gill_plate(self, painter):
         """Gill plate, operculum shading, and expressive mouth geometry."""
-        col = self._lerp_color(self.primary, [0, 0, 0], 0.15)
+        col = self._palette_blends["gill_seam"]
 
         # Operculum volume shadow gives head mass near gill cover.
-        operculum = QRadialGradient(14.0, 0.0, 11.0)
-        operculum.setColorAt(0.0, self._make_color(self._lerp_color(self.primary, [18, 16, 24], 0.38), 44))
-        operculum.setColorAt(0.6, self._make_color(self._lerp_color(self.primary, [18, 16, 24], 0.54), 26))
-        operculum.setColorAt(1.0, QColor(0, 0, 0, 0))
         painter.setPen(Qt.NoPen)
-        painter.setBrush(QBrush(operculum))
+        painter.setBrush(self._radial_brush("operculum", 14.0, 0.0, 11.0, (
+            (0.0, self._make_color(self._palette_blends["operculum_inner"], 44)),
+            (0.6, self._make_color(self._palette_blends["operculum_outer"], 26)),
+            (1.0, _TRANSPARENT),
+        )))
         painter.drawEllipse(QPointF(14.0, 0.0), 10.5, 9.0)
 
         breath = math.sin(self.breath_phase * 2.0) * 1.6
         painter.setBrush(Qt.NoBrush)
 
         # Primary gill arc (main plate seam).
-        painter.setPen(QPen(self._make_color(col, 58), 0.9))
+        painter.setPen(self._pen(col, 58, 0.9))
         gill_path = QPainterPath()
         gill_path.moveTo(16.8, -9.0)
         gill_path.cubicTo(14.4, -4.5, 14.1, 4.6 + breath, 16.7, 9.0)
@@ -723,14 +1223,14 @@ class FishSkin:
         gill_path2 = QPainterPath()
         gill_path2.moveTo(14.5, -7.0)
         gill_path2.cubicTo(12.6, -3.3, 12.4, 3.6 + breath * 0.7, 14.4, 7.0)
-        painter.setPen(QPen(self._make_color(col, 34), 0.55))
+        painter.setPen(self._pen(col, 34, 0.55))
         painter.drawPath(gill_path2)
 
         # Mouth line with slight pout/extension at inhale.
         mouth_open = max(0.0, math.sin(self.breath_phase * 1.5) * 1.0)
         pout = 0.7 + mouth_open * 0.45
-        lip_col = self._lerp_color(self.primary, [0, 0, 0], 0.34)
-        painter.setPen(QPen(self._make_color(lip_col, 78), 0.72))
+        lip_col = self._palette_blends["lip"]
+        painter.setPen(self._pen(lip_col, 78, 0.72))
 
         mouth_upper = QPainterPath()
         mouth_upper.moveTo(32.0, -0.1)
@@ -743,145 +1243,213 @@ class FishSkin:
         painter.drawPath(mouth_lower)
 
         # Tiny reflective lip highlight.
-        painter.setPen(QPen(self._make_color([255, 242, 232], 34), 0.35))
+        painter.setPen(self._pen([255, 242, 232], 34, 0.35))
         painter.drawLine(QPointF(30.2, -0.7), QPointF(28.9 + pout * 0.25, -0.34))
 
     # ---- EYE ----
     def _draw_eye(self, painter, mood, hunger, look_x=0.0, look_y=0.0):
         """Photorealistic eye with corneal reflection and depth."""
-        eye_x, eye_y = 22.6, -4.1
-        eye_r = 5.15
+        eye_x, eye_y = EYE_X, EYE_Y
+        eye_r = EYE_R
+        eye_px = eye_r * self.lod
+
+        if eye_px < LOD_EYE_FLAT_RADIUS:
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(_EYE_FLAT)
+            painter.drawEllipse(QPointF(eye_x, eye_y), eye_r, eye_r * 0.88)
+            return
 
         iris_x = eye_x + look_x
         iris_y = eye_y + look_y
 
-        # Dorsal eyelid shadow for depth/readability.
-        lid_grad = QRadialGradient(eye_x - 0.6, eye_y - 1.6, eye_r * 1.1)
-        lid_grad.setColorAt(0.0, self._make_color(self._lerp_color(self.primary, [16, 14, 18], 0.45), 44))
-        lid_grad.setColorAt(1.0, QColor(0, 0, 0, 0))
-        painter.setPen(Qt.NoPen)
-        painter.setBrush(QBrush(lid_grad))
-        painter.drawEllipse(QPointF(eye_x - 0.3, eye_y - 1.1), eye_r * 1.0, eye_r * 0.72)
-
-        # Dark ring around eye
-        ring_col = self._lerp_color(self.primary, [0, 0, 0], 0.5)
-        painter.setBrush(self._make_color(ring_col, 120))
-        painter.drawEllipse(QPointF(eye_x, eye_y), eye_r + 1.2, eye_r * 0.95 + 1.0)
-
-        # Sclera with slight warm tint
-        painter.setPen(QPen(QColor(60, 55, 50, 180), 0.5))
-        sclera_grad = QRadialGradient(eye_x, eye_y, eye_r)
-        sclera_grad.setColorAt(0.0, QColor(248, 245, 242, 240))
-        sclera_grad.setColorAt(0.7, QColor(235, 228, 220, 235))
-        sclera_grad.setColorAt(1.0, QColor(200, 190, 180, 220))
-        painter.setBrush(QBrush(sclera_grad))
-        painter.drawEllipse(QPointF(eye_x, eye_y), eye_r, eye_r * 0.88)
+        # Eyelid shadow, dark ring and sclera only change with the palette
+        res = self._sprite_resolution(painter)
+        sprite = self._eye_sprite(res)
+        r = _EYE_SPRITE_RECT
+        painter.setRenderHint(QPainter.SmoothPixmapTransform, True)
+        painter.drawPixmap(QRectF(eye_x + r.x(), eye_y + r.y(), r.width(), r.height()),
+                           sprite, QRectF(sprite.rect()))
 
         # Iris - deep complex coloring
         stress = min(1.0, 0.65 * (hunger / 100.0) + 0.35 * (1.0 - mood / 100.0))
-        iris_calm = [20, 35, 90]
-        iris_stressed = [170, 55, 25]
-        iris_col = self._lerp_color(iris_calm, iris_stressed, stress)
-
+        iris_brush, iris_col = self._iris_style(round(stress * EYE_STRESS_STEPS))
         iris_r = eye_r * 0.72
-        iris_grad = QRadialGradient(iris_x - 0.3, iris_y - 0.3, iris_r)
-        iris_grad.setColorAt(0.0, QColor(
-            min(255, iris_col[0] + 40),
-            min(255, iris_col[1] + 30),
-            min(255, iris_col[2] + 20), 255))
-        iris_grad.setColorAt(0.3, QColor(iris_col[0], iris_col[1], iris_col[2], 255))
-        iris_grad.setColorAt(0.7, QColor(
-            max(0, iris_col[0] - 30),
-            max(0, iris_col[1] - 25),
-            max(0, iris_col[2] - 15), 255))
-        iris_grad.setColorAt(1.0, QColor(25, 20, 15, 255))
+        iris_brush.setTransform(QTransform.fromTranslate(iris_x, iris_y))
 
         painter.setPen(Qt.NoPen)
-        painter.setBrush(QBrush(iris_grad))
+        painter.setBrush(iris_brush)
         painter.drawEllipse(QPointF(iris_x, iris_y), iris_r, iris_r * 0.95)
 
         # Iris texture (radial lines)
-        painter.setPen(QPen(QColor(
-            min(255, iris_col[0] + 60),
-            min(255, iris_col[1] + 40),
-            min(255, iris_col[2] + 30), 30), 0.2))
-        for angle in range(0, 360, 20):
-            rad = math.radians(angle)
+        detailed = eye_px >= LOD_EYE_DETAIL_RADIUS
+        if detailed:
+            line_rgb = (min(255, iris_col[0] + 60), min(255, iris_col[1] + 40), min(255, iris_col[2] + 30))
+            if line_rgb != self._iris_line_rgb:
+                self._iris_line_pen.setColor(QColor(*line_rgb, 30))
+                self._iris_line_rgb = line_rgb
+            painter.setPen(self._iris_line_pen)
             inner_r = iris_r * 0.3
             outer_r = iris_r * 0.9
-            painter.drawLine(
-                QPointF(iris_x + math.cos(rad) * inner_r, iris_y + math.sin(rad) * inner_r * 0.95),
-                QPointF(iris_x + math.cos(rad) * outer_r, iris_y + math.sin(rad) * outer_r * 0.95)
-            )
+            inner_ry = inner_r * 0.95
+            outer_ry = outer_r * 0.95
+            painter.drawLines([
+                QLineF(iris_x + cos_a * inner_r, iris_y + sin_a * inner_ry,
+                       iris_x + cos_a * outer_r, iris_y + sin_a * outer_ry)
+                for cos_a, sin_a in _IRIS_DIRS
+            ])
 
         # Pupil with depth
         pupil_size = eye_r * (0.3 + 0.1 * (1.0 - mood / 100.0))
-        pupil_grad = QRadialGradient(iris_x, iris_y, pupil_size)
-        pupil_grad.setColorAt(0.0, QColor(2, 2, 2, 250))
-        pupil_grad.setColorAt(0.7, QColor(8, 5, 3, 245))
-        pupil_grad.setColorAt(1.0, QColor(15, 10, 8, 235))
-        painter.setBrush(QBrush(pupil_grad))
+        self._pupil_brush.setTransform(QTransform(pupil_size, 0, 0, pupil_size, iris_x, iris_y))
+        painter.setBrush(self._pupil_brush)
         painter.drawEllipse(QPointF(iris_x, iris_y), pupil_size, pupil_size * 0.92)
 
-        # Primary specular highlight (corneal reflection)
-        painter.setBrush(QColor(255, 255, 255, 215))
-        painter.drawEllipse(QPointF(iris_x + 1.55, iris_y - 1.55), 1.35, 1.15)
+        if not detailed:
+            # Primary specular highlight only
+            painter.setBrush(_EYE_GLINT_MAIN)
+            painter.drawEllipse(QPointF(iris_x + 1.55, iris_y - 1.55), 1.35, 1.15)
+            return
 
+        # Corneal reflections, fixed relative to the iris
+        sprite = self._glint_sprite(res)
+        r = _GLINT_SPRITE_RECT
+        painter.drawPixmap(QRectF(iris_x + r.x(), iris_y + r.y(), r.width(), r.height()),
+                           sprite, QRectF(sprite.rect()))
+
+    def _sprite_resolution(self, painter):
+        """Pixels per fish unit for the eye sprites: the power of two no smaller
+        than the on-screen scale in device pixels, so that blits only ever
+        scale down. The LOD alone misses the HiDPI device pixel ratio."""
+        scale = self.lod * painter.device().devicePixelRatioF()
+        return 1 << max(0, math.ceil(math.log2(scale))) if scale > 0 else 1
+
+    def _glint_sprite(self, res):
+        """The three corneal highlights around an iris at the origin."""
+        sprite = self._glint_sprites.get(res)
+        if sprite is not None:
+            return sprite
+        r = _GLINT_SPRITE_RECT
+        sprite = QPixmap(round(r.width() * res), round(r.height() * res))
+        sprite.fill(Qt.GlobalColor.transparent)
+
+        sprite_painter = QPainter(sprite)
+        sprite_painter.setRenderHint(QPainter.Antialiasing, True)
+        sprite_painter.scale(res, res)
+        sprite_painter.translate(-r.x(), -r.y())
+        sprite_painter.setPen(Qt.NoPen)
+        # Primary specular highlight (corneal reflection)
+        sprite_painter.setBrush(_EYE_GLINT_MAIN)
+        sprite_painter.drawEllipse(QPointF(1.55, -1.55), 1.35, 1.15)
         # Secondary smaller highlight
-        painter.setBrush(QColor(255, 255, 255, 128))
-        painter.drawEllipse(QPointF(iris_x - 0.75, iris_y + 0.95), 0.68, 0.56)
-
+        sprite_painter.setBrush(_EYE_GLINT_SMALL)
+        sprite_painter.drawEllipse(QPointF(-0.75, 0.95), 0.68, 0.56)
         # Tiny glint for wet-eye realism.
-        painter.setBrush(QColor(255, 255, 255, 86))
-        painter.drawEllipse(QPointF(iris_x + 0.25, iris_y - 0.05), 0.32, 0.28)
+        sprite_painter.setBrush(_EYE_GLINT_TINY)
+        sprite_painter.drawEllipse(QPointF(0.25, -0.05), 0.32, 0.28)
+        sprite_painter.end()
+        return self._glint_sprites.put(res, sprite)
+
+    def _eye_sprite(self, res):
+        """Eyelid shadow, dark ring and sclera, baked per palette at res
+        pixels per fish unit (see _sprite_resolution)."""
+        lid_key = self._rgba_key(self._palette_blends["eyelid"], 44)
+        ring_key = self._rgba_key(self._palette_blends["eye_ring"], 120)
+        key = (lid_key, ring_key, res)
+        sprite = self._eye_sprites.get(key)
+        if sprite is not None:
+            return sprite
+        r = _EYE_SPRITE_RECT
+        sprite = QPixmap(round(r.width() * res), round(r.height() * res))
+        sprite.fill(Qt.GlobalColor.transparent)
+        eye_r = EYE_R
+
+        sprite_painter = QPainter(sprite)
+        sprite_painter.setRenderHint(QPainter.Antialiasing, True)
+        sprite_painter.scale(res, res)
+        sprite_painter.translate(-r.x(), -r.y())
+
+        # Dorsal eyelid shadow for depth/readability.
+        lid_grad = QRadialGradient(-0.6, -1.6, eye_r * 1.1)
+        lid_grad.setColorAt(0.0, self._make_color(self._palette_blends["eyelid"], 44))
+        lid_grad.setColorAt(1.0, _TRANSPARENT)
+        sprite_painter.setPen(Qt.NoPen)
+        sprite_painter.setBrush(QBrush(lid_grad))
+        sprite_painter.drawEllipse(QPointF(-0.3, -1.1), eye_r * 1.0, eye_r * 0.72)
+
+        # Dark ring around eye
+        sprite_painter.setBrush(self._make_color(self._palette_blends["eye_ring"], 120))
+        sprite_painter.drawEllipse(QPointF(0, 0), eye_r + 1.2, eye_r * 0.95 + 1.0)
+
+        # Sclera with slight warm tint
+        sprite_painter.translate(-EYE_X, -EYE_Y)
+        sprite_painter.setPen(self._sclera_pen)
+        sprite_painter.setBrush(self._sclera_brush)
+        sprite_painter.drawEllipse(QPointF(EYE_X, EYE_Y), eye_r, eye_r * 0.88)
+        sprite_painter.end()
+        return self._eye_sprites.put(key, sprite)
+
+    def _iris_style(self, stress_key):
+        """(brush, rgb) of the iris at stress stress_key / EYE_STRESS_STEPS.
+
+        The gradient is centered on the origin; callers translate the brush.
+        """
+        cached = self._iris_brushes.get(stress_key)
+        if cached is not None:
+            return cached
+        iris_calm = [20, 35, 90]
+        iris_stressed = [170, 55, 25]
+        iris_col = self._lerp_color(iris_calm, iris_stressed, stress_key / EYE_STRESS_STEPS)
+
+        iris_grad = QRadialGradient(-0.3, -0.3, EYE_R * 0.72)
+        iris_grad.setColorAt(0.0, QColor(
+            min(255, iris_col[0] + 40),
+            min(255, iris_col[1] + 30),
+            min(255, iris_col[2] + 20), 255))
+        iris_grad.setColorAt(0.3, QColor(iris_col[0], iris_col[1], iris_col[2], 255))
+        iris_grad.setColorAt(0.7, QColor(
+            max(0, iris_col[0] - 30),
+            max(0, iris_col[1] - 25),
+            max(0, iris_col[2] - 15), 255))
+        iris_grad.setColorAt(1.0, QColor(25, 20, 15, 255))
+        return self._iris_brushes.put(stress_key, (QBrush(iris_grad), iris_col))
 
     # ---- SCALES ----
     def _draw_scales(self, painter, speed_factor):
         """Iridescent scale pattern that shimmers with angle."""
-        shimmer_base = 12 + 8 * math.sin(self.time * 1.5) + self.swim_cadence * 6 + self.turn_intensity * 5
+        t = self.time
+        shimmer_base = 12 + 8 * math.sin(t * 1.5) + self.swim_cadence * 6 + self.turn_intensity * 5
         painter.setPen(Qt.NoPen)
 
-        # Scale rows following body contour
-        scale_rows = [
-            (-7, 5, 7),   # (y_offset, num_cols, start_x)
-            (0, 8, 10),
-            (7, 7, 8),
-        ]
-
-        for y_off, num_cols, start_x in scale_rows:
-            for col_idx in range(num_cols):
-                t = col_idx / max(1, num_cols - 1)
-                sx = start_x - col_idx * 6.5
-                sy = y_off
-
-                # Shimmer based on position and time
-                shimmer = self.perlin.noise2d(
-                    sx * 0.1 + self.time * 0.8,
-                    sy * 0.1 + self.time * 0.3
-                )
-                alpha = max(0, min(60, int(shimmer_base + shimmer * 25)))
-
-                # Iridescent color shift per scale
-                irid_shift = self.perlin2.noise2d(sx * 0.05, sy * 0.05 + self.time * 0.5)
-                if irid_shift > 0.2:
-                    scale_col = self._lerp_color(self.primary, [200, 255, 255], irid_shift * 0.5)
-                elif irid_shift < -0.2:
-                    scale_col = self._lerp_color(self.primary, [255, 200, 255], abs(irid_shift) * 0.5)
-                else:
-                    scale_col = self._lerp_color([255, 255, 255], self.primary, 0.3)
-
-                painter.setBrush(self._make_color(scale_col, alpha))
-                # Crescent-shaped scales
-                scale_path = QPainterPath()
-                scale_path.moveTo(sx - 2.5, sy)
-                scale_path.cubicTo(
-                    sx - 1.5, sy - 2.8,
-                    sx + 1.5, sy - 2.8,
-                    sx + 2.5, sy
-                )
-                scale_path.cubicTo(
-                    sx + 1.2, sy - 1.0,
-                    sx - 1.2, sy - 1.0,
-                    sx - 2.5, sy
-                )
-                painter.drawPath(scale_path)
+        # Shimmer (alpha) and iridescent color shift per scale, snapped to
+        # buckets so that more scales share a color and land in the same
+        # batched fill below. Each scale's fill is packed into one int: color
+        # table index above 6 bits of alpha.
+        fills = self._scale_fills
+        if HAS_NUMBA:
+            _compute_scale_fills(t, shimmer_base, self.perlin.perm, self.perlin2.perm, fills)
+        else:
+            shimmers = self.perlin.noise2d_array(_SCALE_SHIMMER_X + t * 0.8, _SCALE_SHIMMER_Y + t * 0.3)
+            irid_shifts = self.perlin2.noise2d_array(_SCALE_IRID_X, _SCALE_IRID_Y + t * 0.5)
+            alphas = np.clip((shimmer_base + shimmers * 25).astype(int), 0, 60) & ~SCALE_ALPHA_MASK
+            fills[:] = np.searchsorted(_IRID_EDGES, irid_shifts) << 6 | alphas
+
+        # Scales never overlap, so those sharing a color are filled as one path
+        batches = {}
+        get_batch = batches.get
+        pool = self._scale_batch_paths
+        for scale_path, fill in zip(self._scale_paths, fills.tolist()):
+            batch = get_batch(fill)
+            if batch is None:
+                batch = batches[fill] = pool[len(batches)]
+                batch.clear()
+            batch.addPath(scale_path)
+
+        lut = self._irid_lut
+        make_color = self._make_color
+        set_brush = painter.setBrush
+        draw_path = painter.drawPath
+        painter.setRenderHint(QPainter.Antialiasing, self._smooth_details)
+        for fill, batch in batches.items():
+            set_brush(make_color(lut[fill >> 6], fill & 63))
+            draw_path(batch)
+        painter.setRenderHint(QPainter.Antialiasing, True)
@@ -51,8 +51,8 @@ class RealisticBettaSkin:
     }
 
     def __init__(self, config=None):
-        self.perlin = PerlinNoise(seed=42)
-        self.perlin2 = PerlinNoise(seed=137)
+        self.perlin = PerlinNoise.shared(42)
+        self.perlin2 = PerlinNoise.shared(137)
         self.time = 0.0
         self.tail_phase = 0.0
         self.body_wave_phase = 0.0
@@ -0,0 +1,21 @@
+"""
+Optional Numba JIT support.
+Kernels decorated with njit are compiled to native code when numba is
+installed and run as plain NumPy code otherwise, so they must stick to
+array operations both can execute.
+"""
+
+try:
+    from numba import njit as _numba_njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+def njit(*args, **kwargs):
+    """numba.njit when available, otherwise a pass-through decorator."""
+    if HAS_NUMBA:
+        return _numba_njit(*args, **kwargs)
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return args[0]
+    return lambda fn: fn